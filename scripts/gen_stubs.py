@@ -0,0 +1,58 @@
+"""
+Regenerates the IDE stub files (`xboto/client.pyi` / `xboto/resource.pyi`) from the
+service index of whatever boto3/botocore versions are currently installed.
+
+The runtime stays fully dynamic (any service boto supports works whether or not it is
+listed in a stub); the stubs exist purely so IDEs can autocomplete module attributes.
+Re-run after upgrading boto to pick up newly added services:
+
+    python scripts/gen_stubs.py
+"""
+import keyword
+from pathlib import Path
+
+import boto3
+
+_HEADER = """\
+# Type-hints for common boto {kind}s, for IDE-type-completion;
+# any {kind} boto supports will work when asked for
+# (even if not listed below, see module docstring in `{module}.py`).
+#
+# Generated by `scripts/gen_stubs.py`; re-run that instead of editing by hand.
+from typing import Any
+
+"""
+
+_FOOTER = """\
+
+
+def __getattr__(name: str) -> Any: ...
+"""
+
+
+def attr_name(service_name: str) -> str:
+    name = service_name.replace('-', '_')
+    if keyword.iskeyword(name):
+        # ie: `lambda` -- a bare keyword wouldn't parse as an annotation; the runtime
+        # `__getattr__` strips the trailing underscore when looking the service up.
+        name += '_'
+    return name
+
+
+def write_stub(path: Path, kind: str, names):
+    lines = [_HEADER.format(kind=kind, module=path.stem)]
+    lines.extend(f'{attr_name(name)}: Any\n' for name in sorted(names))
+    lines.append(_FOOTER)
+    path.write_text(''.join(lines))
+    print(f'wrote {path} ({len(names)} {kind}s)')
+
+
+def main():
+    session = boto3.Session()
+    package_dir = Path(__file__).resolve().parent.parent / 'xboto'
+    write_stub(package_dir / 'client.pyi', 'client', session.get_available_services())
+    write_stub(package_dir / 'resource.pyi', 'resource', session.get_available_resources())
+
+
+if __name__ == '__main__':
+    main()
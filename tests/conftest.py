@@ -1,10 +1,8 @@
 import pytest
-import moto
-from xboto.resource import dynamodb
-from xboto.client import ssm
 import os
 
 # Ensure we don't have any real keys/id's; just in case.
+# (must happen at collection time, before anything imports/uses boto3)
 os.environ['AWS_ACCESS_KEY_ID'] = ''
 os.environ['AWS_SECRET_ACCESS_KEY'] = ''
 os.environ['AWS_SESSION_TOKEN'] = ''
@@ -12,14 +10,37 @@ os.environ['AWS_REGION'] = 'us-east-1'
 os.environ['AWS_DEFAULT_REGION'] = 'us-east-1'
 
 
-@pytest.fixture(autouse=True)
-def mock_dynamodb():
-    with moto.mock_dynamodb():
-        yield dynamodb
+# The moto import is inside the fixtures (not at module top-level) so pytest
+# collection does not pay the sizable boto3+moto import cost for runs that
+# don't end up executing any of these tests.
+#
+# The moto mock is session-scoped so we only pay for entering/exiting it
+# (and the monkey-patching it does) once for the entire run;
+# the `reset_moto_backends` fixture below keeps tests isolated from each other.
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_aws_services():
+    moto = pytest.importorskip("moto")
+
+    if hasattr(moto, 'mock_aws'):
+        # moto >= 5 patches once for every service via the unified mock.
+        with moto.mock_aws():
+            yield
+    else:
+        # Older moto (what we currently pin) only has per-service mocks.
+        with moto.mock_dynamodb(), moto.mock_ssm():
+            yield
 
 
 @pytest.fixture(autouse=True)
-def mock_ssm():
-    with moto.mock_ssm():
-        yield ssm
+def reset_moto_backends(mock_aws_services):
+    # Clear out any state a test put into moto's in-memory backends,
+    # without tearing down and rebuilding the session-scoped mock itself.
+    yield
+    from moto.dynamodb.models import dynamodb_backends
+    from moto.ssm.models import ssm_backends
 
+    for backends in (dynamodb_backends, ssm_backends):
+        for account_backends in backends.values():
+            for backend in account_backends.values():
+                backend.reset()
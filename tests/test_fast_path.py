@@ -0,0 +1,44 @@
+from xboto.dependencies import BotoClients, BotoSession
+
+
+def test_repeated_get_uses_fast_path(monkeypatch):
+    # First access resolves + caches the client on the dependency instance.
+    dep = BotoClients.Ssm.grab()
+    first = dep.get()
+
+    # After that, repeated access should be answered by the fast-path cache,
+    # never falling back to the BotoSession store.
+    store_hits = []
+    orig = BotoSession._boto_obj_for_dependency
+
+    def counting(self, dependency, constructor, force_create=False):
+        store_hits.append(dependency)
+        return orig(self, dependency, constructor, force_create)
+
+    monkeypatch.setattr(BotoSession, '_boto_obj_for_dependency', counting)
+
+    for _ in range(10):
+        assert dep.get() is first
+
+    assert store_hits == []
+
+
+def test_reset_invalidates_fast_path():
+    dep = BotoClients.Ssm.grab()
+    first = dep.get()
+
+    # `reset` must drop the fast-path cache along with the store entry,
+    # so the next access lazily creates a brand-new client.
+    dep.reset()
+    assert dep.get() is not first
+
+
+def test_session_change_invalidates_fast_path():
+    dep = BotoClients.Ssm.grab()
+    first = dep.get()
+
+    with BotoSession():
+        assert dep.get() is not first
+
+    # Original session active again; we should get the original client back.
+    assert dep.get() is first
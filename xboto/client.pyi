@@ -0,0 +1,441 @@
+# Type-hints for common boto clients, for IDE-type-completion;
+# any client boto supports will work when asked for
+# (even if not listed below, see module docstring in `client.py`).
+#
+# Generated by `scripts/gen_stubs.py`; re-run that instead of editing by hand.
+from typing import Any
+
+accessanalyzer: Any
+account: Any
+account_access: Any
+acm: Any
+acm_pca: Any
+agent_registry: Any
+agent_registry_control: Any
+aiops: Any
+amp: Any
+amplify: Any
+amplifybackend: Any
+amplifyuibuilder: Any
+apigateway: Any
+apigatewaymanagementapi: Any
+apigatewayv2: Any
+appconfig: Any
+appconfigdata: Any
+appfabric: Any
+appflow: Any
+appintegrations: Any
+application_autoscaling: Any
+application_insights: Any
+application_signals: Any
+applicationcostprofiler: Any
+appmesh: Any
+apprunner: Any
+appstream: Any
+appsync: Any
+arc_region_switch: Any
+arc_zonal_shift: Any
+artifact: Any
+athena: Any
+auditmanager: Any
+autoscaling: Any
+autoscaling_plans: Any
+b2bi: Any
+backup: Any
+backup_gateway: Any
+backupsearch: Any
+batch: Any
+bcm_dashboards: Any
+bcm_data_exports: Any
+bcm_pricing_calculator: Any
+bcm_recommended_actions: Any
+bedrock: Any
+bedrock_agent: Any
+bedrock_agent_runtime: Any
+bedrock_agentcore: Any
+bedrock_agentcore_control: Any
+bedrock_data_automation: Any
+bedrock_data_automation_runtime: Any
+bedrock_runtime: Any
+billing: Any
+billingconductor: Any
+braket: Any
+budgets: Any
+ce: Any
+chatbot: Any
+chime: Any
+chime_sdk_identity: Any
+chime_sdk_media_pipelines: Any
+chime_sdk_meetings: Any
+chime_sdk_messaging: Any
+chime_sdk_voice: Any
+cleanrooms: Any
+cleanroomsml: Any
+cloud9: Any
+cloudcontrol: Any
+clouddirectory: Any
+cloudformation: Any
+cloudfront: Any
+cloudfront_keyvaluestore: Any
+cloudhsm: Any
+cloudhsmv2: Any
+cloudsearch: Any
+cloudsearchdomain: Any
+cloudtrail: Any
+cloudtrail_data: Any
+cloudwatch: Any
+codeartifact: Any
+codebuild: Any
+codecatalyst: Any
+codecommit: Any
+codeconnections: Any
+codedeploy: Any
+codeguru_reviewer: Any
+codeguru_security: Any
+codeguruprofiler: Any
+codepipeline: Any
+codestar_connections: Any
+codestar_notifications: Any
+cognito_identity: Any
+cognito_idp: Any
+cognito_sync: Any
+comprehend: Any
+comprehendmedical: Any
+compute_optimizer: Any
+compute_optimizer_automation: Any
+config: Any
+connect: Any
+connect_contact_lens: Any
+connectcampaigns: Any
+connectcampaignsv2: Any
+connectcases: Any
+connecthealth: Any
+connectparticipant: Any
+controlcatalog: Any
+controltower: Any
+cost_optimization_hub: Any
+cur: Any
+customer_profiles: Any
+databrew: Any
+dataexchange: Any
+datapipeline: Any
+datasync: Any
+datazone: Any
+dax: Any
+deadline: Any
+detective: Any
+devicefarm: Any
+devops_agent: Any
+devops_guru: Any
+directconnect: Any
+discovery: Any
+dlm: Any
+dms: Any
+docdb: Any
+docdb_elastic: Any
+drs: Any
+ds: Any
+ds_data: Any
+dsql: Any
+dynamodb: Any
+dynamodbstreams: Any
+ebs: Any
+ec2: Any
+ec2_instance_connect: Any
+ecr: Any
+ecr_public: Any
+ecs: Any
+efs: Any
+eks: Any
+eks_auth: Any
+elasticache: Any
+elasticbeanstalk: Any
+elb: Any
+elbv2: Any
+elementalinference: Any
+emr: Any
+emr_containers: Any
+emr_serverless: Any
+entityresolution: Any
+es: Any
+events: Any
+evs: Any
+finspace: Any
+finspace_data: Any
+firehose: Any
+fis: Any
+fms: Any
+forecast: Any
+forecastquery: Any
+frauddetector: Any
+freetier: Any
+fsx: Any
+gamelift: Any
+gameliftstreams: Any
+geo_maps: Any
+geo_places: Any
+geo_routes: Any
+glacier: Any
+globalaccelerator: Any
+glue: Any
+grafana: Any
+greengrass: Any
+greengrassv2: Any
+groundstation: Any
+guardduty: Any
+health: Any
+healthlake: Any
+iam: Any
+iam_toolbox: Any
+identitystore: Any
+imagebuilder: Any
+importexport: Any
+inspector: Any
+inspector_scan: Any
+inspector2: Any
+interconnect: Any
+internetmonitor: Any
+invoicing: Any
+iot: Any
+iot_data: Any
+iot_jobs_data: Any
+iot_managed_integrations: Any
+iotdeviceadvisor: Any
+iotfleetwise: Any
+iotsecuretunneling: Any
+iotsitewise: Any
+iotthingsgraph: Any
+iottwinmaker: Any
+iotwireless: Any
+ivs: Any
+ivs_realtime: Any
+ivschat: Any
+kafka: Any
+kafkaconnect: Any
+kendra: Any
+kendra_ranking: Any
+keyspaces: Any
+keyspacesstreams: Any
+kinesis: Any
+kinesis_video_archived_media: Any
+kinesis_video_media: Any
+kinesis_video_signaling: Any
+kinesis_video_webrtc_storage: Any
+kinesisanalytics: Any
+kinesisanalyticsv2: Any
+kinesisvideo: Any
+kms: Any
+lakeformation: Any
+lambda_: Any
+lambda_core: Any
+lambda_microvms: Any
+launch_wizard: Any
+lex_models: Any
+lex_runtime: Any
+lexv2_models: Any
+lexv2_runtime: Any
+license_manager: Any
+license_manager_linux_subscriptions: Any
+license_manager_user_subscriptions: Any
+lightsail: Any
+location: Any
+logs: Any
+lookoutequipment: Any
+m2: Any
+machinelearning: Any
+macie2: Any
+mailmanager: Any
+managedblockchain: Any
+managedblockchain_query: Any
+marketplace_agreement: Any
+marketplace_catalog: Any
+marketplace_deployment: Any
+marketplace_discovery: Any
+marketplace_entitlement: Any
+marketplace_reporting: Any
+marketplacecommerceanalytics: Any
+mediaconnect: Any
+mediaconvert: Any
+medialive: Any
+mediapackage: Any
+mediapackage_vod: Any
+mediapackagev2: Any
+mediastore: Any
+mediastore_data: Any
+mediatailor: Any
+medical_imaging: Any
+memorydb: Any
+meteringmarketplace: Any
+mgh: Any
+mgn: Any
+migration_hub_refactor_spaces: Any
+migrationhub_config: Any
+migrationhuborchestrator: Any
+migrationhubstrategy: Any
+mpa: Any
+mq: Any
+mturk: Any
+mwaa: Any
+mwaa_serverless: Any
+neptune: Any
+neptune_graph: Any
+neptunedata: Any
+network_firewall: Any
+networkflowmonitor: Any
+networkmanager: Any
+networkmonitor: Any
+notifications: Any
+notificationscontacts: Any
+nova_act: Any
+oam: Any
+observabilityadmin: Any
+odb: Any
+omics: Any
+opensearch: Any
+opensearchserverless: Any
+organizations: Any
+osis: Any
+outposts: Any
+partnercentral_account: Any
+partnercentral_benefits: Any
+partnercentral_channel: Any
+partnercentral_revenue_measurement: Any
+partnercentral_selling: Any
+payment_cryptography: Any
+payment_cryptography_data: Any
+pca_connector_ad: Any
+pca_connector_scep: Any
+pcs: Any
+personalize: Any
+personalize_events: Any
+personalize_runtime: Any
+pi: Any
+pinpoint: Any
+pinpoint_email: Any
+pinpoint_sms_voice: Any
+pinpoint_sms_voice_v2: Any
+pipes: Any
+polly: Any
+pricing: Any
+pricing_plan_manager: Any
+proton: Any
+qapps: Any
+qbusiness: Any
+qconnect: Any
+quicksight: Any
+ram: Any
+rbin: Any
+rds: Any
+rds_data: Any
+redshift: Any
+redshift_data: Any
+redshift_serverless: Any
+rekognition: Any
+repostspace: Any
+resiliencehub: Any
+resiliencehubv2: Any
+resource_explorer_2: Any
+resource_groups: Any
+resourcegroupstaggingapi: Any
+rolesanywhere: Any
+route53: Any
+route53_recovery_cluster: Any
+route53_recovery_control_config: Any
+route53_recovery_readiness: Any
+route53domains: Any
+route53globalresolver: Any
+route53profiles: Any
+route53resolver: Any
+rtbfabric: Any
+rum: Any
+s3: Any
+s3control: Any
+s3files: Any
+s3outposts: Any
+s3tables: Any
+s3vectors: Any
+sagemaker: Any
+sagemaker_a2i_runtime: Any
+sagemaker_edge: Any
+sagemaker_featurestore_runtime: Any
+sagemaker_geospatial: Any
+sagemaker_metrics: Any
+sagemaker_runtime: Any
+sagemakerjobruntime: Any
+savingsplans: Any
+scheduler: Any
+schemas: Any
+sdb: Any
+secretsmanager: Any
+security_ir: Any
+securityagent: Any
+securityhub: Any
+securitylake: Any
+serverlessrepo: Any
+service_quotas: Any
+servicecatalog: Any
+servicecatalog_appregistry: Any
+servicediscovery: Any
+ses: Any
+sesv2: Any
+shield: Any
+signer: Any
+signer_data: Any
+signin: Any
+simpledbv2: Any
+sms_voice: Any
+snow_device_management: Any
+snowball: Any
+sns: Any
+socialmessaging: Any
+sqs: Any
+ssm: Any
+ssm_contacts: Any
+ssm_guiconnect: Any
+ssm_incidents: Any
+ssm_quicksetup: Any
+ssm_sap: Any
+sso: Any
+sso_admin: Any
+sso_oidc: Any
+stepfunctions: Any
+storagegateway: Any
+sts: Any
+supplychain: Any
+support: Any
+support_app: Any
+supportauthz: Any
+sustainability: Any
+swf: Any
+synthetics: Any
+taxsettings: Any
+textract: Any
+timestream_influxdb: Any
+timestream_query: Any
+timestream_write: Any
+tnb: Any
+transcribe: Any
+transfer: Any
+translate: Any
+trustedadvisor: Any
+uxc: Any
+verifiedpermissions: Any
+voice_id: Any
+vpc_lattice: Any
+waf: Any
+waf_regional: Any
+wafv2: Any
+wellarchitected: Any
+wickr: Any
+wisdom: Any
+workdocs: Any
+workmail: Any
+workmailmessageflow: Any
+workspaces: Any
+workspaces_instances: Any
+workspaces_thin_client: Any
+workspaces_web: Any
+xray: Any
+
+
+def __getattr__(name: str) -> Any: ...
@@ -20,14 +20,109 @@ Or
 >>> from xboto.client import dynamodb
 >>> dynamodb.Table("some-table")
 """
-from typing import Any, Optional, Dict, Type, Callable
+import contextvars
+import functools
+import sys
+import threading
+import weakref
+from types import MappingProxyType
+from typing import (
+    Any, FrozenSet, Iterable, Mapping, Optional, Dict, Tuple, Type, Callable, TYPE_CHECKING
+)
 
 import boto3
 import botocore
+import botocore.config
 from botocore.session import Session
 from xsentinels import Singleton
 from xinject import Dependency, XContext
 
+_shared_data_loader = None
+_shared_data_loader_lock = threading.Lock()
+
+# Precompiled table for the `_` -> `-` service-name translation done on lookups.
+_UNDERSCORE_TO_HYPHEN = str.maketrans('_', '-')
+
+
+@functools.lru_cache(maxsize=None)
+def _normalize_boto_name(raw_name: str) -> str:
+    """
+    Normalizes a lookup name (ie: `Lambda_`, `kinesis_video_media`) into the name boto
+    knows (`lambda`, `kinesis-video-media`): underscores become hyphens, lower-cased,
+    and a trailing underscore/hyphen is dropped (ie: for `lambda_`). Memoized, so
+    repeated lookups of the same raw name skip the string work entirely.
+    """
+    name = raw_name.translate(_UNDERSCORE_TO_HYPHEN).lower()
+    if name.endswith('-'):
+        name = name[:-1]
+    # Interned, so the dict probes keyed by these names (class registry, known-service
+    # sets) get pointer-identity comparisons instead of char-by-char equality.
+    return sys.intern(name)
+
+
+# Shared by every client/resource dependency that was created without any kwargs
+# (the common case); treated as read-only, it's only ever replaced wholesale.
+_EMPTY_BOTO_KWARGS: Dict[str, Any] = {}
+
+
+def _shared_loader():
+    """
+    Lazily creates (and caches) a single botocore data `Loader` that every session we
+    create shares; the loader is what reads + parses the (large) gzipped-JSON service
+    model files, and it caches them internally. Sharing one means a new `BotoSession`
+    (ie: unit-tests re-creating sessions) does not re-read/re-parse models that some
+    previous session already loaded.
+    """
+    global _shared_data_loader
+
+    # Double-checked locking: steady-state callers get the loader with a single
+    # read and no lock acquisition; only the first-creation path synchronizes.
+    loader = _shared_data_loader
+    if loader is not None:
+        return loader
+
+    with _shared_data_loader_lock:
+        if _shared_data_loader is None:
+            import os.path
+            import botocore.loaders
+
+            # boto3 ships its own model files (the `resources-1` ones) in its `data`
+            # dir, outside botocore's builtin search path; include it like
+            # `boto3.Session` does for its loader so this one can serve both kinds.
+            boto3_data = os.path.join(os.path.dirname(boto3.__file__), 'data')
+            _shared_data_loader = botocore.loaders.Loader(extra_search_paths=[boto3_data])
+        return _shared_data_loader
+
+
+@functools.lru_cache(maxsize=None)
+def _known_service_names(boto_kind: str) -> FrozenSet[str]:
+    """
+    The (normalized) service names the installed boto actually supports for the given
+    kind (`'client'`/`'resource'`); lazily scanned from the shared data loader's model
+    index the first time it's needed and cached after that.
+    """
+    model_type = 'service-2' if boto_kind == 'client' else 'resources-1'
+    # Interned to match `_normalize_boto_name` output (see there for why).
+    return frozenset(sys.intern(s) for s in _shared_loader().list_available_services(model_type))
+
+
+class _SessionState:
+    """
+    Per-context state for a `BotoSession`: the lazily-created boto3 Session for that
+    thread/task, plus the boto clients/resources created from it (see
+    `BotoSession._boto_obj_for_dependency`). Stamped with the owning `BotoSession`'s
+    generation so a `BotoSession.reset_session` invalidates every context's state at once.
+    """
+    __slots__ = ('session', 'store', 'creators', 'generation')
+
+    def __init__(self, generation: int):
+        self.session: Optional[boto3.Session] = None
+        # Weak keys: a transient dependency (ie: one made just for a `with` block) that
+        # gets collected takes its cached boto obj with it instead of leaking it here.
+        self.store: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.creators: dict = {}
+        self.generation = generation
+
 
 class BotoSession(Dependency):
     """
@@ -39,20 +134,64 @@ class BotoSession(Dependency):
     When user is not using a session to create a client/resource,
     boto3 uses an internal/default session instead which is not thread-safe.
 
+    Because of that, each thread that asks me for a session gets its own lazily-created
+    boto3 Session (stored in a `contextvars.ContextVar`, so separate asyncio tasks in
+    the same thread also get their own); no locking is needed on the hot path.
+
     - Or the docs for boto about this:
         - https://boto3.amazonaws.com/v1/documentation/api/latest/guide/session.html
     - For various examples see issue where people talk about it:
         - https://github.com/boto/botocore/issues/1246
     """
 
+    # Our own fixed set of attributes as slots; the (unslotted) Dependency base still
+    # gives instances a `__dict__`, but the hot attributes below get C-level slot access.
+    __slots__ = ('reset_session_when_activated', '_session_kwargs', '_state_cv', '_generation')
+
+    def _state(self) -> _SessionState:
+        state = self._state_cv.get()
+        if state is None or state.generation != self._generation:
+            # Either first use in this thread/task, or `reset_session` was called since
+            # this context's state was created (generation mismatch); start fresh.
+            state = _SessionState(self._generation)
+            self._state_cv.set(state)
+        return state
+
     @property
     def session(self) -> boto3.Session:
-        if session := self._session:
+        state = self._state()
+        if session := state.session:
             return session
         session = boto3.Session(**self._session_kwargs)
-        self._session = session
+
+        # Unless the user supplied their own botocore session, swap in the shared
+        # data-loader so service models parsed by any previous session get reused.
+        if 'botocore_session' not in self._session_kwargs:
+            loader = _shared_loader()
+            # noinspection PyProtectedMember
+            session._session.register_component('data_loader', loader)
+            # boto3 already captured its default loader into `session._loader` during
+            # __init__, and `Session.resource` loads its resource models through that
+            # attribute (not the component); point it at the shared loader too so
+            # resource (resources-1) models are shared alongside the client ones.
+            session._loader = loader
+
+        state.session = session
         return session
 
+    def _creator_for(self, boto_kind: str) -> Callable:
+        """
+        Returns the bound client/resource creation method (ie: `session.client` or
+        `session.resource`) for the current context's session; cached per-context so we
+        skip the session property + getattr on every boto-obj creation.
+        """
+        state = self._state()
+        creator = state.creators.get(boto_kind)
+        if creator is None:
+            creator = getattr(self.session, boto_kind)
+            state.creators[boto_kind] = creator
+        return creator
+
     def __init__(
             self, *,
             reset_session_when_activated=False,
@@ -89,16 +228,28 @@ class BotoSession(Dependency):
             **session_kwargs: Pass additional args for boto Session here
                 (for additional args that boto3 might add in the future).
         """
-        # Easily grab all boto args passed into us...
-        args = {k: v for k, v in locals().items() if v is not None}
-        args.pop('self', None)
-        args.pop('reset_session_when_activated', None)
-        args.pop('session_kwargs', None)
+        # Easily grab all boto args passed into us (skipping any that weren't provided);
+        # (explicit pairs, so we don't have to snapshot the whole frame via `locals()`)...
+        args = {}
+        for key, value in (
+            ('aws_access_key_id', aws_access_key_id),
+            ('aws_secret_access_key', aws_secret_access_key),
+            ('aws_session_token', aws_session_token),
+            ('region_name', region_name),
+            ('botocore_session', botocore_session),
+            ('profile_name', profile_name),
+        ):
+            if value is not None:
+                args[key] = value
 
         # Remember args...
         self.reset_session_when_activated = reset_session_when_activated
         self._session_kwargs = {**args, **session_kwargs}
-        self._boto_obj_store = {}
+        # A `ContextVar` behaves like a thread-local (each thread starts with the
+        # default), but additionally gives each asyncio task its own copy;
+        # per-instance so separate `BotoSession` dependencies don't share state.
+        self._state_cv = contextvars.ContextVar(f'xboto-session-state-{id(self)}', default=None)
+        self._generation = 0
 
     def context_resource_for_copy(
             self, *, current_context: XContext, copied_context: XContext
@@ -108,8 +259,10 @@ class BotoSession(Dependency):
         return self
 
     @property
-    def session_kwargs(self) -> Dict[str, Any]:
-        return self._session_kwargs.copy()
+    def session_kwargs(self) -> Mapping[str, Any]:
+        # Read-only, zero-copy view; callers that need a mutable dict can do
+        # `dict(obj.session_kwargs)` (assigning to the property is the way to change them).
+        return MappingProxyType(self._session_kwargs)
 
     @session_kwargs.setter
     def session_kwargs(self, value: Dict[str, Any]):
@@ -117,13 +270,15 @@ class BotoSession(Dependency):
         self.reset_session()
 
     def reset_session(self):
-        # We will lazily create session and their associated boto-objs in the future as needed.
-        self._session = None
-        self._boto_obj_store = {}
+        # We will lazily create sessions and their associated boto-objs per-context in the
+        # future as needed. Bumping the generation invalidates every thread's/task's state
+        # at once (each context lazily discards its stale state; see `_state` and
+        # `_BaseBotoClientOrResource.get`).
+        self._generation += 1
 
-    _session: Optional[boto3.Session] = None
     _session_kwargs: dict
-    _boto_obj_store: dict
+    _state_cv: 'contextvars.ContextVar[Optional[_SessionState]]'
+    _generation: int
 
     def _boto_obj_for_dependency(
             self,
@@ -131,15 +286,23 @@ class BotoSession(Dependency):
             constructor: Callable,
             force_create: bool = False
     ):
-        if not force_create and (boto_obj := self._boto_obj_store.get(dependency)):
-            return boto_obj
+        store = self._state().store
+
+        # Entries are stamped with the dependency's reset-count, so a
+        # `_BaseBotoClientOrResource.reset` on any thread invalidates every
+        # thread's cached copy of that dependency's boto obj.
+        # noinspection PyProtectedMember
+        if not force_create and (entry := store.get(dependency)):
+            if entry[0] == dependency._reset_count:
+                return entry[1]
 
         boto_obj = constructor()
-        self._boto_obj_store[dependency] = boto_obj
+        # noinspection PyProtectedMember
+        store[dependency] = (dependency._reset_count, boto_obj)
         return boto_obj
 
     def _reset_boto_obj_for_dependency(self, dependency: '_BaseBotoClientOrResource'):
-        self._boto_obj_store.pop(dependency, None)
+        self._state().store.pop(dependency, None)
 
 
 boto_session = BotoSession.proxy()
@@ -147,6 +310,32 @@ boto_session = BotoSession.proxy()
     `_Loader` subclasses use this right now (see below).
 """
 
+_default_boto_config: Optional[botocore.config.Config] = None
+
+
+def _default_config() -> botocore.config.Config:
+    """
+    Default botocore config used when creating a client/resource that was not given an
+    explicit `config` (you can always pass your own `config` via `boto_kwargs` to override).
+
+    Raises boto's default `max_pool_connections` (10) so concurrent use does not force
+    extra TCP+TLS handshakes, and uses the adaptive retry mode so transient throttling
+    is recovered from without app code.
+
+    Also turns on TCP keepalive (when the installed botocore supports it, >= 1.27.84)
+    so idle pooled sockets don't silently die and pile up in CLOSE_WAIT.
+    """
+    global _default_boto_config
+    if _default_boto_config is None:
+        kwargs: Dict[str, Any] = dict(
+            max_pool_connections=50,
+            retries={'max_attempts': 10, 'mode': 'adaptive'},
+        )
+        if 'tcp_keepalive' in botocore.config.Config.OPTION_DEFAULTS:
+            kwargs['tcp_keepalive'] = True
+        _default_boto_config = botocore.config.Config(**kwargs)
+    return _default_boto_config
+
 
 class _BaseBotoClientOrResource(Dependency):
     # Instead of inheriting from `ThreadUnsafeResource`, we set flag directly ourselves.
@@ -157,11 +346,35 @@ class _BaseBotoClientOrResource(Dependency):
     _boto_name: str = ''
     _boto_kind: str = ''
 
-    # Instance Vars
+    # Instance Vars (as slots; the unslotted Dependency base still gives instances a
+    # `__dict__`, but the attributes hit by `get` become C-level slot reads)
+    __slots__ = (
+        '_boto_kwargs', '_effective_boto_kwargs',
+        '_fast_cache',
+        '_reset_count',
+    )
 
     # These are used to keep track of how we configure(d) the boto client/resource.
     _boto_kwargs: Dict[str, Any]
 
+    # `_boto_kwargs` with the default `config` merged in when the user didn't supply
+    # one; precomputed whenever the kwargs change so client/resource construction can
+    # use it as-is (see `_set_boto_kwargs`).
+    _effective_boto_kwargs: Dict[str, Any]
+
+    # Fast-path cache of the last boto client/resource we resolved, along with the
+    # `BotoSession` (and its generation) it came from and that session's per-context
+    # state it resolved against, so we know when it's stale
+    # (sessions and their boto objs are per-thread/per-task).
+    #
+    # One tuple in one slot on purpose: a single attribute load/store is atomic under
+    # the GIL, so another thread refreshing this cache can never be observed half-way
+    # (obj from one context, validity metadata from another).
+    _fast_cache: Optional[Tuple[Any, 'BotoSession', int, _SessionState]]
+
+    # Bumped on every `reset`, invalidating cached boto objs for us on all threads.
+    _reset_count: int
+
     def __init__(
             self, region_name=None,
             api_version=None,
@@ -221,63 +434,105 @@ class _BaseBotoClientOrResource(Dependency):
                 for more details.
             **boto_kwargs:
         """  # noqa -- url can't be broken up.
-        # Easily grab all boto args passed into us...
-        args = {k: v for k, v in locals().items() if v is not None}
-        args.pop('self', None)
-        args.pop('boto_kwargs', None)
-
-        self._boto_kwargs = {**args, **boto_kwargs}
+        # Easily grab all boto args passed into us (skipping any that weren't provided);
+        # (explicit pairs, so we don't have to snapshot the whole frame via `locals()`)...
+        args = {}
+        for key, value in (
+            ('region_name', region_name),
+            ('api_version', api_version),
+            ('use_ssl', use_ssl),
+            ('verify', verify),
+            ('endpoint_url', endpoint_url),
+            ('aws_access_key_id', aws_access_key_id),
+            ('aws_secret_access_key', aws_secret_access_key),
+            ('aws_session_token', aws_session_token),
+            ('config', config),
+        ):
+            if value is not None:
+                args[key] = value
+
+        if args or boto_kwargs:
+            self._set_boto_kwargs({**args, **boto_kwargs})
+        else:
+            # Most dependencies (ie: plain `boto_clients.ssm`) are created with no kwargs;
+            # share a single empty dict instead of allocating one per instance.
+            self._set_boto_kwargs(_EMPTY_BOTO_KWARGS)
+        self._fast_cache = None
+        self._reset_count = 0
 
     def __init_subclass__(cls, boto_name: str = '', boto_kind: str = '', **kwargs):
         super().__init_subclass__(**kwargs)
         cls._boto_name = boto_name
         cls._boto_kind = boto_kind
 
+    def _set_boto_kwargs(self, boto_kwargs: Dict[str, Any]):
+        self._boto_kwargs = boto_kwargs
+        # Merge in the default config once, up-front; construction then passes the
+        # precomputed dict straight through instead of re-merging on every miss.
+        if 'config' in boto_kwargs:
+            self._effective_boto_kwargs = boto_kwargs
+        else:
+            self._effective_boto_kwargs = {**boto_kwargs, 'config': _default_config()}
+
     def reset(self):
         """ Resets the client; it will be re-created lazily next time it's asked for.
         """
+        self._fast_cache = None
+        self._reset_count += 1
         # noinspection PyProtectedMember
         BotoSession.grab()._reset_boto_obj_for_dependency(self)
 
     def get(self):
-        # If user specified their own 'endpoint_url', we are not using the default.
-        # Otherwise, check to make sure settings value is still same as what we used;
-        # we want a new object if the default endpoint_url has changed...
-        #
-        # For now, we just throw-away any old object if default has changed and user did not
-        # specify their own endpoint_url value. If it changes frequently for some reason we
-        # could optimize by store a client per-endpoint_url value, so we can reuse old
-        # client when old values are restored.
+        # Any `endpoint_url` (or other kwargs) the user gave us are baked into the
+        # created boto obj; changing them goes through the `boto_kwargs` setter, which
+        # calls `reset` -- so a cached obj here always matches the current kwargs and
+        # we never need to force re-creation on a normal read.
+        session = BotoSession.grab()
+
+        # Fast-path: if the active BotoSession is the one we last resolved against, it has
+        # not been reset since (generation match), and we are in the thread/task that
+        # resolved it (same per-context state object), skip the store lookup entirely.
+        # The cache is read into a local as one tuple so a concurrent refresh by
+        # another thread is seen either entirely or not at all, never torn.
+        # noinspection PyProtectedMember
+        cached = self._fast_cache
+        if (
+            cached is not None
+            and cached[1] is session
+            and cached[2] == session._generation
+            and cached[3] is session._state_cv.get()
+        ):
+            return cached[0]
 
         def constructor():
-            # `kind` is either 'client' or 'resource', we get the correct creation method...
-            boto_creation_method = getattr(boto_session.session, self._boto_kind)
+            # `kind` is either 'client' or 'resource', we get the correct creation method
+            # (bound + cached per-context on the session we already grabbed)...
+            # noinspection PyProtectedMember
+            boto_creation_method = session._creator_for(self._boto_kind)
 
-            # We then call creation method with the resource/client name and any other kwargs;
-            # For the kwargs, we start with any defaults and then add in user specified ones...
+            # The kwargs (with the default config already merged in when the user didn't
+            # give one) were precomputed when they were last set; pass them straight through.
             return boto_creation_method(
-                self._boto_name, **self._boto_kwargs
+                self._boto_name, **self._effective_boto_kwargs
             )
 
         # noinspection PyProtectedMember
-        return BotoSession.grab()._boto_obj_for_dependency(self, constructor)
+        boto_obj = session._boto_obj_for_dependency(self, constructor)
+
+        # noinspection PyProtectedMember
+        self._fast_cache = (boto_obj, session, session._generation, session._state_cv.get())
+        return boto_obj
 
     @classmethod
     def _get_dependency_cls(cls, boto_name: str) -> 'Type[_BaseBotoClientOrResource]':
         boto_kind = cls._boto_kind
 
-        # Normalize name...
-        # Client/Resources names never use `_`, they use a `-` instead.
-        # Replace any `_` with a `-`
-        # (allows one to still get it via attributes, vs having to pass a str into a/the method)
-        boto_name = boto_name.replace("_", "-")
-        boto_name = boto_name.lower()
+        # Client/Resources names never use `_`, they use a `-` instead
+        # (allows one to still get it via attributes,
+        #  vs having to pass a str into a/the method)...
+        boto_name = _normalize_boto_name(boto_name)
 
-        if boto_name.endswith("-"):
-            # Remove ending underscore (ie: for the `lambda_` name).
-            boto_name = boto_name[:-1]
-
-        if dep_cls := _dependency_classes[boto_kind].get(boto_name):
+        if dep_cls := _dependency_classes.get((boto_kind, boto_name)):
             return dep_cls
 
         # We are creating a new type/class lazily based on the required boto resource/client...
@@ -285,7 +540,7 @@ class _BaseBotoClientOrResource(Dependency):
         dep_cls: Any = type(cls_name, (cls,), {}, boto_name=boto_name, boto_kind=boto_kind)
 
         # Store the type for future use.
-        _dependency_classes[boto_kind][boto_name] = dep_cls
+        _dependency_classes[(boto_kind, boto_name)] = dep_cls
         return dep_cls
 
     @classmethod
@@ -293,16 +548,17 @@ class _BaseBotoClientOrResource(Dependency):
         raise NotImplementedError("Need to implement `get_dependency_cls` class method")
 
     @property
-    def boto_kwargs(self) -> Dict[str, Any]:
+    def boto_kwargs(self) -> Mapping[str, Any]:
         """
-        Returns a copy of the boto_kwargs assigned either while creating object in init
-        `_BaseBotoClientOrResource.__init__ or changed via `boto_kwargs` setter property
-        after it was created.
+        Returns a read-only view of the boto_kwargs assigned either while creating object
+        in init `_BaseBotoClientOrResource.__init__ or changed via `boto_kwargs` setter
+        property after it was created (use `dict(obj.boto_kwargs)` if you need a mutable
+        copy; assigning to the property is how you change them).
 
         Any settings defined in dict will be passed to boto-client/resource when it's lazily
         created.
         """
-        return self._boto_kwargs.copy()
+        return MappingProxyType(self._boto_kwargs)
 
     @boto_kwargs.setter
     def boto_kwargs(self, value: Dict[str, Any]):
@@ -316,11 +572,13 @@ class _BaseBotoClientOrResource(Dependency):
         time that a boto-client/resource is asked of me I'll lazily create a new client/resource
         with the setting provided to this property-setter.
         """
-        self._boto_kwargs = {**value}
+        self._set_boto_kwargs({**value})
         self.reset()
 
 
 class BotoClient(_BaseBotoClientOrResource, boto_kind='client'):
+    __slots__ = ()
+
     @property
     def boto_client(self):
         return self.get()
@@ -331,6 +589,8 @@ class BotoClient(_BaseBotoClientOrResource, boto_kind='client'):
 
 
 class BotoResource(_BaseBotoClientOrResource, boto_kind='resource'):
+    __slots__ = ()
+
     @property
     def boto_resource(self):
         return self.get()
@@ -340,31 +600,51 @@ class BotoResource(_BaseBotoClientOrResource, boto_kind='resource'):
         return cls._get_dependency_cls(boto_name)
 
 
-_dependency_classes: Dict[str, Dict[str, Type[BotoClient]]] = {
-    'resource': {},
-    'client': {}
-}
+# Flat map of `(boto_kind, normalized_name)` -> lazily-built dependency class;
+# a single probe (one tuple hash over two short strings) per lookup.
+_dependency_classes: Dict[Tuple[str, str], Type[_BaseBotoClientOrResource]] = {}
 
 
 class _LoaderMetaclass(type):
     _boto_dependency_class: Type[_BaseBotoClientOrResource]
 
     def __getattr__(self, key: str):
-        if not key[0].isupper():
+        # Plain ASCII range check; service class names are always ASCII and this
+        # avoids the unicode-category lookup `str.isupper` does.
+        if not ('A' <= key[0] <= 'Z'):
             raise AttributeError(
                 f"BotoClient/BotoResource classes start with an upper-case char, "
                 f"was instead given ({key})."
             )
-        try:
-            return self._boto_dependency_class.get_dependency_cls(key)
-        except Exception as e:
+
+        dep_base = self._boto_dependency_class
+
+        # Fast path: once a key's dependency class has been built, this is a memoized
+        # normalization plus one dict probe -- no exception machinery.
+        normalized = _normalize_boto_name(key)
+        # noinspection PyProtectedMember
+        boto_kind = dep_base._boto_kind
+        dep_cls = _dependency_classes.get((boto_kind, normalized))
+        if dep_cls is not None:
+            return dep_cls
+
+        # Typos and tooling probes get a clean AttributeError before we build anything;
+        # names that pass are guaranteed valid, so the class construction below can't
+        # fail on bad input.
+        if normalized not in _known_service_names(boto_kind):
             raise AttributeError(
-                f"BotoClient/BotoResource class does not exist for key ({key}) "
-                f"start with an upper-case char, was instead given ({key})."
+                f"BotoClient/BotoResource class does not exist for key ({key}); "
+                f"boto3 has no {boto_kind} named ({normalized})."
             )
 
+        return dep_base.get_dependency_cls(key)
+
 
 class _Loader(Dependency, metaclass=_LoaderMetaclass):
+    # No per-instance state at all (the lookup caches are class-level), so no slots;
+    # the (unslotted) Dependency base still provides a `__dict__`.
+    __slots__ = ()
+
     def __init_subclass__(
             cls, boto_dependency_class: Optional[Type[_BaseBotoClientOrResource]] = None, **kwargs
     ):
@@ -373,6 +653,79 @@ class _Loader(Dependency, metaclass=_LoaderMetaclass):
         )
         cls._boto_dependency_class = boto_dependency_class
 
+        # Fresh per-subclass closure cache (see `_lookup`), so clients/resources
+        # don't mix.
+        cls._lookup_fn_cache = {}
+
+    @classmethod
+    def warm_cache(cls):
+        """
+        Optional startup helper: pre-builds the dependency class for every service the
+        installed boto supports for this loader's kind (ie: every client for
+        `BotoClients.warm_cache()`), so no first-access in the process ever pays for
+        name normalization or class creation.
+
+        Not called automatically -- building the long tail of classes is wasted work
+        for most apps (classes are cheap to build lazily as needed); call this from
+        app startup only if you'd rather pay the one-time upfront cost.
+        """
+        dep_base = cls._boto_dependency_class
+        # noinspection PyProtectedMember
+        for name in _known_service_names(dep_base._boto_kind):
+            dep_base.get_dependency_cls(name)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def proxy_attribute(cls, attribute_name: str) -> Any:
+        """
+        Same as `xinject.Dependency.proxy_attribute`, but memoized: the returned
+        proxies are stateless (they resolve the current dependency on every use),
+        so every request for the same attribute can share a single proxy object
+        instead of allocating a new wrapper each time (ie: when many modules each
+        do `from xboto.client import ssm`).
+        """
+        return super().proxy_attribute(attribute_name)
+
+    @classmethod
+    def prewarm(cls, names: Iterable[str], max_workers: int = 8):
+        """
+        Eagerly builds the boto client/resource for each given name, in parallel
+        (ie: `BotoClients.prewarm(['s3', 'dynamodb'])` from app/Lambda init-time code).
+
+        The expensive part of a first use -- reading + parsing a service's gzipped-JSON
+        model files -- lands in the shared data loader that every session reuses, so
+        later first-touches of these services in any thread/task skip that cost.
+        The boto objs themselves stay per-thread as always; threads other than the
+        warming workers still lazily build their own (cheap once the models are warm).
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        dep_base = cls._boto_dependency_class
+        names = list(names)
+        if not names:
+            return
+
+        def warm(name: str):
+            dep_base.get_dependency_cls(name).grab().get()
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as executor:
+            # `list` drains the iterator, propagating any worker exception to the caller.
+            list(executor.map(warm, names))
+
+    def prefetch(self, *names: str):
+        """
+        Eagerly resolves several clients/resources at once
+        (ie: `boto_clients.prefetch('s3', 'dynamodb', 'sqs')` at app startup).
+
+        The expensive model loads happen in parallel via `prewarm` (wallclock is
+        roughly the slowest single service, since botocore's file reads release the
+        GIL), then each name is touched on the calling thread/task so its boto obj is
+        built and cached in the context that will actually use it.
+        """
+        self.prewarm(names)
+        for name in names:
+            self._lookup(name)
+
     def load(self, module):
         """
         This is a way you can use a dynamic string to grab a boto3 client/resource by name.
@@ -420,13 +773,35 @@ class _Loader(Dependency, metaclass=_LoaderMetaclass):
         # using `module` as the attr-name (see `_Loader.__getattr__`)
         return getattr(self, module)
 
+    # Per-subclass cache of precompiled lookup closures; each closure captures its
+    # already-resolved dependency class, so every lookup after a name's first skips
+    # the name normalization + registry lookup and just does `grab().get()`.
+    _lookup_fn_cache: Dict[str, Callable[[], Any]]
+
     def _lookup(self, module):
-        """Implemented in subclasses to look up the module from boto3 properly."""
-        raise NotImplementedError(f"Need to implement `_lookup` in subclass ({self}).")
+        """Looks up the current boto3 client/resource for `module` (ie: `'ssm'`)."""
+        fn = self._lookup_fn_cache.get(module)
+        if fn is None:
+            dep_cls = self._boto_dependency_class.get_dependency_cls(module)
+
+            def fn(_dep_cls=dep_cls):
+                return _dep_cls.grab().get()
 
-    def __getattribute__(self, item):
+            self._lookup_fn_cache[module] = fn
+        return fn()
+
+    def __getattr__(self, item):
         """
-        Grabs a client/resource and stores it on self, returns it.
+        Grabs a client/resource via `_Loader._lookup` and returns it.
+
+        Only called when normal attribute lookup fails, ie: for client/resource names
+        such as `boto_clients.ssm`; ordinary methods/attributes never pay for this.
+
+        We deliberately do NOT store the resolved boto obj on self:
+        the currently-active `BotoSession` (or the dependency's `boto_kwargs`) can
+        change at any time and every access must honor that. The caching that makes
+        repeated access cheap lives on the dependency instances instead
+        (see `_BaseBotoClientOrResource.get`).
 
         Args:
             item: item-name to get
@@ -434,11 +809,7 @@ class _Loader(Dependency, metaclass=_LoaderMetaclass):
         Returns:
 
         """
-        try:
-            return super().__getattribute__(item)
-        except AttributeError:
-            client = self._lookup(item)
-            return client
+        return self._lookup(item)
 
 
 class BotoClients(_Loader, boto_dependency_class=BotoClient):
@@ -466,700 +837,696 @@ class BotoClients(_Loader, boto_dependency_class=BotoClient):
     You can also directly use the `xboto.dependencies.BotoClients.load` method, and use a `-`
     there.
     """
+    __slots__ = ()
 
-    def _lookup(self, module):
-        return BotoClient.get_dependency_cls(module).grab().boto_client
-
-    # These annotations are only for IDE-type-completion;
-    # any client boto supports will work regardless (even if not listed below).
-    #
-    # These are the xyn-resource `Resource` types/classes; ie: BotoClient subclasses
-    # (start with upper-case letter)
-    AccessAnalyzer: Type[BotoClient]
-    Account: Type[BotoClient]
-    Acm: Type[BotoClient]
-    Acm_Pca: Type[BotoClient]
-    AlexaForBusiness: Type[BotoClient]
-    Amp: Type[BotoClient]
-    Amplify: Type[BotoClient]
-    AmplifyBackend: Type[BotoClient]
-    AmplifyUiBuilder: Type[BotoClient]
-    ApiGateway: Type[BotoClient]
-    ApiGatewayManagementApi: Type[BotoClient]
-    ApiGatewayV2: Type[BotoClient]
-    AppConfig: Type[BotoClient]
-    AppConfigData: Type[BotoClient]
-    Appflow: Type[BotoClient]
-    AppIntegrations: Type[BotoClient]
-    Application_Autoscaling: Type[BotoClient]
-    Application_Insights: Type[BotoClient]
-    Applicationcostprofiler: Type[BotoClient]
-    Appmesh: Type[BotoClient]
-    Apprunner: Type[BotoClient]
-    Appstream: Type[BotoClient]
-    Appsync: Type[BotoClient]
-    Arc_Zonal_Shift: Type[BotoClient]
-    Athena: Type[BotoClient]
-    AuditManager: Type[BotoClient]
-    Autoscaling: Type[BotoClient]
-    Autoscaling_Plans: Type[BotoClient]
-    Backup: Type[BotoClient]
-    Backup_Gateway: Type[BotoClient]
-    BackupStorage: Type[BotoClient]
-    Batch: Type[BotoClient]
-    BillingConductor: Type[BotoClient]
-    Braket: Type[BotoClient]
-    Budgets: Type[BotoClient]
-    Ce: Type[BotoClient]
-    Chime: Type[BotoClient]
-    Chime_Sdk_Identity: Type[BotoClient]
-    Chime_Sdk_Media_Pipelines: Type[BotoClient]
-    Chime_Sdk_Meetings: Type[BotoClient]
-    Chime_Sdk_Messaging: Type[BotoClient]
-    Chime_Sdk_Voice: Type[BotoClient]
-    Cleanrooms: Type[BotoClient]
-    Cloud9: Type[BotoClient]
-    Cloudcontrol: Type[BotoClient]
-    Clouddirectory: Type[BotoClient]
-    Cloudformation: Type[BotoClient]
-    Cloudfront: Type[BotoClient]
-    Cloudhsm: Type[BotoClient]
-    Cloudhsmv2: Type[BotoClient]
-    Cloudsearch: Type[BotoClient]
-    Cloudsearchdomain: Type[BotoClient]
-    Cloudtrail: Type[BotoClient]
-    Cloudtrail_Data: Type[BotoClient]
-    Cloudwatch: Type[BotoClient]
-    CodeArtifact: Type[BotoClient]
-    CodeBuild: Type[BotoClient]
-    CodeCatalyst: Type[BotoClient]
-    CodeCommit: Type[BotoClient]
-    CodeDeploy: Type[BotoClient]
-    Codeguru_Reviewer: Type[BotoClient]
-    CodeguruProfiler: Type[BotoClient]
-    CodePipeline: Type[BotoClient]
-    Codestar: Type[BotoClient]
-    Codestar_Connections: Type[BotoClient]
-    Codestar_Notifications: Type[BotoClient]
-    Cognito_Identity: Type[BotoClient]
-    Cognito_Idp: Type[BotoClient]
-    Cognito_Sync: Type[BotoClient]
-    Comprehend: Type[BotoClient]
-    Comprehendmedical: Type[BotoClient]
-    Compute_Optimizer: Type[BotoClient]
-    Config: Type[BotoClient]
-    Connect: Type[BotoClient]
-    Connect_Contact_Lens: Type[BotoClient]
-    ConnectCampaigns: Type[BotoClient]
-    ConnectCases: Type[BotoClient]
-    ConnectParticipant: Type[BotoClient]
-    ControlTower: Type[BotoClient]
-    Cur: Type[BotoClient]
-    Customer_Profiles: Type[BotoClient]
-    DataBrew: Type[BotoClient]
-    DataExchange: Type[BotoClient]
-    DataPipeline: Type[BotoClient]
-    DataSync: Type[BotoClient]
-    Dax: Type[BotoClient]
-    Detective: Type[BotoClient]
-    Devicefarm: Type[BotoClient]
-    Devops_Guru: Type[BotoClient]
-    DirectConnect: Type[BotoClient]
-    Discovery: Type[BotoClient]
-    Dlm: Type[BotoClient]
-    Dms: Type[BotoClient]
-    Docdb: Type[BotoClient]
-    Docdb_Elastic: Type[BotoClient]
-    Drs: Type[BotoClient]
-    Ds: Type[BotoClient]
-    DynamoDb: Type[BotoClient]
-    DynamoDbStreams: Type[BotoClient]
-    Ebs: Type[BotoClient]
-    Ec2: Type[BotoClient]
-    Ec2_Instance_Connect: Type[BotoClient]
-    Ecr: Type[BotoClient]
-    Ecr_Public: Type[BotoClient]
-    Ecs: Type[BotoClient]
-    Efs: Type[BotoClient]
-    Eks: Type[BotoClient]
-    Elastic_Inference: Type[BotoClient]
-    Elasticache: Type[BotoClient]
-    ElasticBeanstalk: Type[BotoClient]
-    ElasticTranscoder: Type[BotoClient]
-    Elb: Type[BotoClient]
-    Elbv2: Type[BotoClient]
-    Emr: Type[BotoClient]
-    Emr_Containers: Type[BotoClient]
-    Emr_Serverless: Type[BotoClient]
-    Es: Type[BotoClient]
-    Events: Type[BotoClient]
-    Evidently: Type[BotoClient]
-    Finspace: Type[BotoClient]
-    Finspace_Data: Type[BotoClient]
-    Firehose: Type[BotoClient]
-    Fis: Type[BotoClient]
-    Fms: Type[BotoClient]
-    Forecast: Type[BotoClient]
-    Forecastquery: Type[BotoClient]
-    Frauddetector: Type[BotoClient]
-    Fsx: Type[BotoClient]
-    Gamelift: Type[BotoClient]
-    Gamesparks: Type[BotoClient]
-    Glacier: Type[BotoClient]
-    Globalaccelerator: Type[BotoClient]
-    Glue: Type[BotoClient]
-    Grafana: Type[BotoClient]
-    Greengrass: Type[BotoClient]
-    Greengrassv2: Type[BotoClient]
-    Groundstation: Type[BotoClient]
-    Guardduty: Type[BotoClient]
-    Health: Type[BotoClient]
-    Healthlake: Type[BotoClient]
-    Honeycode: Type[BotoClient]
-    Iam: Type[BotoClient]
-    IdentityStore: Type[BotoClient]
-    ImageBuilder: Type[BotoClient]
-    ImportExport: Type[BotoClient]
-    Inspector: Type[BotoClient]
-    Inspector2: Type[BotoClient]
-    Iot: Type[BotoClient]
-    Iot_Data: Type[BotoClient]
-    Iot_Jobs_Data: Type[BotoClient]
-    Iot_Roborunner: Type[BotoClient]
-    Iot1Click_Devices: Type[BotoClient]
-    Iot1Click_Projects: Type[BotoClient]
-    IotAnalytics: Type[BotoClient]
-    IotDeviceAdvisor: Type[BotoClient]
-    IotEvents: Type[BotoClient]
-    IotEvents_Data: Type[BotoClient]
-    IotFleethub: Type[BotoClient]
-    IotFleetwise: Type[BotoClient]
-    IotSecureTunneling: Type[BotoClient]
-    IotSitewise: Type[BotoClient]
-    IotThingsgraph: Type[BotoClient]
-    IotTwinmaker: Type[BotoClient]
-    IotWireless: Type[BotoClient]
-    Ivs: Type[BotoClient]
-    Ivschat: Type[BotoClient]
-    Kafka: Type[BotoClient]
-    Kafkaconnect: Type[BotoClient]
-    Kendra: Type[BotoClient]
-    Kendra_Ranking: Type[BotoClient]
-    Keyspaces: Type[BotoClient]
-    Kinesis: Type[BotoClient]
-    Kinesis_Video_Archived_Media: Type[BotoClient]
-    Kinesis_Video_Media: Type[BotoClient]
-    Kinesis_Video_Signaling: Type[BotoClient]
-    Kinesis_Video_Webrtc_Storage: Type[BotoClient]
-    KinesisAnalytics: Type[BotoClient]
-    KinesisAnalyticsv2: Type[BotoClient]
-    Kinesisvideo: Type[BotoClient]
-    Kms: Type[BotoClient]
-    Lakeformation: Type[BotoClient]
-    # Lambda Is A Key-Word, Underscore Is Ignored.
-    Lambda_: Type[BotoClient]
-    Lex_Models: Type[BotoClient]
-    Lex_Runtime: Type[BotoClient]
-    Lexv2_Models: Type[BotoClient]
-    Lexv2_Runtime: Type[BotoClient]
-    License_Manager: Type[BotoClient]
-    License_Manager_Linux_Subscriptions: Type[BotoClient]
-    License_Manager_User_Subscriptions: Type[BotoClient]
-    Lightsail: Type[BotoClient]
-    Location: Type[BotoClient]
-    Logs: Type[BotoClient]
-    LookoutEquipment: Type[BotoClient]
-    LookoutMetrics: Type[BotoClient]
-    LookoutVision: Type[BotoClient]
-    M2: Type[BotoClient]
-    MachineLearning: Type[BotoClient]
-    Macie: Type[BotoClient]
-    Macie2: Type[BotoClient]
-    ManagedBlockchain: Type[BotoClient]
-    MarketPlace_Catalog: Type[BotoClient]
-    MarketPlace_Entitlement: Type[BotoClient]
-    MarketPlacecommerceanalytics: Type[BotoClient]
-    MediaConnect: Type[BotoClient]
-    MediaConvert: Type[BotoClient]
-    MediaLive: Type[BotoClient]
-    MediaPackage: Type[BotoClient]
-    MediaPackage_Vod: Type[BotoClient]
-    MediaStore: Type[BotoClient]
-    MediaStore_Data: Type[BotoClient]
-    MediaTailor: Type[BotoClient]
-    MemoryDb: Type[BotoClient]
-    MeteringMarketplace: Type[BotoClient]
-    Mgh: Type[BotoClient]
-    Mgn: Type[BotoClient]
-    Migration_Hub_Refactor_Spaces: Type[BotoClient]
-    MigrationHub_Config: Type[BotoClient]
-    MigrationHubOrchestrator: Type[BotoClient]
-    MigrationHubStrategy: Type[BotoClient]
-    Mobile: Type[BotoClient]
-    Mq: Type[BotoClient]
-    Mturk: Type[BotoClient]
-    Mwaa: Type[BotoClient]
-    Neptune: Type[BotoClient]
-    Network_Firewall: Type[BotoClient]
-    Networkmanager: Type[BotoClient]
-    Nimble: Type[BotoClient]
-    Oam: Type[BotoClient]
-    Omics: Type[BotoClient]
-    Opensearch: Type[BotoClient]
-    OpensearchServerless: Type[BotoClient]
-    Opsworks: Type[BotoClient]
-    Opsworkscm: Type[BotoClient]
-    Organizations: Type[BotoClient]
-    Outposts: Type[BotoClient]
-    Panorama: Type[BotoClient]
-    Personalize: Type[BotoClient]
-    Personalize_Events: Type[BotoClient]
-    Personalize_Runtime: Type[BotoClient]
-    Pi: Type[BotoClient]
-    Pinpoint: Type[BotoClient]
-    Pinpoint_Email: Type[BotoClient]
-    Pinpoint_Sms_Voice: Type[BotoClient]
-    Pinpoint_Sms_Voice_V2: Type[BotoClient]
-    Pipes: Type[BotoClient]
-    Polly: Type[BotoClient]
-    Pricing: Type[BotoClient]
-    Privatenetworks: Type[BotoClient]
-    Proton: Type[BotoClient]
-    Qldb: Type[BotoClient]
-    Qldb_Session: Type[BotoClient]
-    Quicksight: Type[BotoClient]
-    Ram: Type[BotoClient]
-    Rbin: Type[BotoClient]
-    Rds: Type[BotoClient]
-    Rds_Data: Type[BotoClient]
-    Redshift: Type[BotoClient]
-    Redshift_Data: Type[BotoClient]
-    Redshift_Serverless: Type[BotoClient]
-    Rekognition: Type[BotoClient]
-    Resiliencehub: Type[BotoClient]
-    Resource_Explorer_2: Type[BotoClient]
-    Resource_Groups: Type[BotoClient]
-    ResourceGroupStaggingApi: Type[BotoClient]
-    Robomaker: Type[BotoClient]
-    Rolesanywhere: Type[BotoClient]
-    Route53: Type[BotoClient]
-    Route53_Recovery_Cluster: Type[BotoClient]
-    Route53_Recovery_Control_Config: Type[BotoClient]
-    Route53_Recovery_Readiness: Type[BotoClient]
-    Route53Domains: Type[BotoClient]
-    Route53Resolver: Type[BotoClient]
-    Rum: Type[BotoClient]
-    S3: Type[BotoClient]
-    S3Control: Type[BotoClient]
-    S3Outposts: Type[BotoClient]
-    Sagemaker: Type[BotoClient]
-    Sagemaker_A2I_Runtime: Type[BotoClient]
-    Sagemaker_Edge: Type[BotoClient]
-    Sagemaker_Featurestore_Runtime: Type[BotoClient]
-    Sagemaker_Geospatial: Type[BotoClient]
-    Sagemaker_Metrics: Type[BotoClient]
-    Sagemaker_Runtime: Type[BotoClient]
-    SavingsPlans: Type[BotoClient]
-    Scheduler: Type[BotoClient]
-    Schemas: Type[BotoClient]
-    Sdb: Type[BotoClient]
-    Secretsmanager: Type[BotoClient]
-    Securityhub: Type[BotoClient]
-    Securitylake: Type[BotoClient]
-    Serverlessrepo: Type[BotoClient]
-    Service_Quotas: Type[BotoClient]
-    ServiceCatalog: Type[BotoClient]
-    ServiceCatalog_Appregistry: Type[BotoClient]
-    ServiceDiscovery: Type[BotoClient]
-    Ses: Type[BotoClient]
-    Sesv2: Type[BotoClient]
-    Shield: Type[BotoClient]
-    Signer: Type[BotoClient]
-    Simspaceweaver: Type[BotoClient]
-    Sms: Type[BotoClient]
-    Sms_Voice: Type[BotoClient]
-    Snow_Device_Management: Type[BotoClient]
-    Snowball: Type[BotoClient]
-    Sns: Type[BotoClient]
-    Sqs: Type[BotoClient]
-    Ssm: Type[BotoClient]
-    Ssm_Contacts: Type[BotoClient]
-    Ssm_Incidents: Type[BotoClient]
-    Ssm_Sap: Type[BotoClient]
-    Sso: Type[BotoClient]
-    Sso_Admin: Type[BotoClient]
-    Sso_Oidc: Type[BotoClient]
-    StepFunctions: Type[BotoClient]
-    StorageGateway: Type[BotoClient]
-    Sts: Type[BotoClient]
-    Support: Type[BotoClient]
-    Support_App: Type[BotoClient]
-    Swf: Type[BotoClient]
-    Synthetics: Type[BotoClient]
-    Textract: Type[BotoClient]
-    Timestream_Query: Type[BotoClient]
-    Timestream_Write: Type[BotoClient]
-    Transcribe: Type[BotoClient]
-    Transfer: Type[BotoClient]
-    Translate: Type[BotoClient]
-    Voice_Id: Type[BotoClient]
-    Waf: Type[BotoClient]
-    Waf_Regional: Type[BotoClient]
-    Wafv2: Type[BotoClient]
-    WellArchitected: Type[BotoClient]
-    Wisdom: Type[BotoClient]
-    Workdocs: Type[BotoClient]
-    Worklink: Type[BotoClient]
-    Workmail: Type[BotoClient]
-    WorkmailMessageFlow: Type[BotoClient]
-    Workspaces: Type[BotoClient]
-    Workspaces_Web: Type[BotoClient]
-    Xray: Type[BotoClient]
-
-    # These annotations are only for IDE-type-completion;
+    # These annotations are only for IDE-type-completion, so they are
+    # excluded from runtime entirely (no per-class __annotations__ cost);
     # any client boto supports will work regardless (even if not listed below).
-    #
-    # These are the boto client objects (start with lower-case letter)
-    accessanalyzer: Any
-    account: Any
-    acm: Any
-    acm_pca: Any
-    alexaforbusiness: Any
-    amp: Any
-    amplify: Any
-    amplifybackend: Any
-    amplifyuibuilder: Any
-    apigateway: Any
-    apigatewaymanagementapi: Any
-    apigatewayv2: Any
-    appconfig: Any
-    appconfigdata: Any
-    appflow: Any
-    appintegrations: Any
-    application_autoscaling: Any
-    application_insights: Any
-    applicationcostprofiler: Any
-    appmesh: Any
-    apprunner: Any
-    appstream: Any
-    appsync: Any
-    arc_zonal_shift: Any
-    athena: Any
-    auditmanager: Any
-    autoscaling: Any
-    autoscaling_plans: Any
-    backup: Any
-    backup_gateway: Any
-    backupstorage: Any
-    batch: Any
-    billingconductor: Any
-    braket: Any
-    budgets: Any
-    ce: Any
-    chime: Any
-    chime_sdk_identity: Any
-    chime_sdk_media_pipelines: Any
-    chime_sdk_meetings: Any
-    chime_sdk_messaging: Any
-    chime_sdk_voice: Any
-    cleanrooms: Any
-    cloud9: Any
-    cloudcontrol: Any
-    clouddirectory: Any
-    cloudformation: Any
-    cloudfront: Any
-    cloudhsm: Any
-    cloudhsmv2: Any
-    cloudsearch: Any
-    cloudsearchdomain: Any
-    cloudtrail: Any
-    cloudtrail_data: Any
-    cloudwatch: Any
-    codeartifact: Any
-    codebuild: Any
-    codecatalyst: Any
-    codecommit: Any
-    codedeploy: Any
-    codeguru_reviewer: Any
-    codeguruprofiler: Any
-    codepipeline: Any
-    codestar: Any
-    codestar_connections: Any
-    codestar_notifications: Any
-    cognito_identity: Any
-    cognito_idp: Any
-    cognito_sync: Any
-    comprehend: Any
-    comprehendmedical: Any
-    compute_optimizer: Any
-    config: Any
-    connect: Any
-    connect_contact_lens: Any
-    connectcampaigns: Any
-    connectcases: Any
-    connectparticipant: Any
-    controltower: Any
-    cur: Any
-    customer_profiles: Any
-    databrew: Any
-    dataexchange: Any
-    datapipeline: Any
-    datasync: Any
-    dax: Any
-    detective: Any
-    devicefarm: Any
-    devops_guru: Any
-    directconnect: Any
-    discovery: Any
-    dlm: Any
-    dms: Any
-    docdb: Any
-    docdb_elastic: Any
-    drs: Any
-    ds: Any
-    dynamodb: Any
-    dynamodbstreams: Any
-    ebs: Any
-    ec2: Any
-    ec2_instance_connect: Any
-    ecr: Any
-    ecr_public: Any
-    ecs: Any
-    efs: Any
-    eks: Any
-    elastic_inference: Any
-    elasticache: Any
-    elasticbeanstalk: Any
-    elastictranscoder: Any
-    elb: Any
-    elbv2: Any
-    emr: Any
-    emr_containers: Any
-    emr_serverless: Any
-    es: Any
-    events: Any
-    evidently: Any
-    finspace: Any
-    finspace_data: Any
-    firehose: Any
-    fis: Any
-    fms: Any
-    forecast: Any
-    forecastquery: Any
-    frauddetector: Any
-    fsx: Any
-    gamelift: Any
-    gamesparks: Any
-    glacier: Any
-    globalaccelerator: Any
-    glue: Any
-    grafana: Any
-    greengrass: Any
-    greengrassv2: Any
-    groundstation: Any
-    guardduty: Any
-    health: Any
-    healthlake: Any
-    honeycode: Any
-    iam: Any
-    identitystore: Any
-    imagebuilder: Any
-    importexport: Any
-    inspector: Any
-    inspector2: Any
-    iot: Any
-    iot_data: Any
-    iot_jobs_data: Any
-    iot_roborunner: Any
-    iot1click_devices: Any
-    iot1click_projects: Any
-    iotanalytics: Any
-    iotdeviceadvisor: Any
-    iotevents: Any
-    iotevents_data: Any
-    iotfleethub: Any
-    iotfleetwise: Any
-    iotsecuretunneling: Any
-    iotsitewise: Any
-    iotthingsgraph: Any
-    iottwinmaker: Any
-    iotwireless: Any
-    ivs: Any
-    ivschat: Any
-    kafka: Any
-    kafkaconnect: Any
-    kendra: Any
-    kendra_ranking: Any
-    keyspaces: Any
-    kinesis: Any
-    kinesis_video_archived_media: Any
-    kinesis_video_media: Any
-    kinesis_video_signaling: Any
-    kinesis_video_webrtc_storage: Any
-    kinesisanalytics: Any
-    kinesisanalyticsv2: Any
-    kinesisvideo: Any
-    kms: Any
-    lakeformation: Any
-    # Lambda is a key-word, underscore is ignored.
-    lambda_: Any
-    lex_models: Any
-    lex_runtime: Any
-    lexv2_models: Any
-    lexv2_runtime: Any
-    license_manager: Any
-    license_manager_linux_subscriptions: Any
-    license_manager_user_subscriptions: Any
-    lightsail: Any
-    location: Any
-    logs: Any
-    lookoutequipment: Any
-    lookoutmetrics: Any
-    lookoutvision: Any
-    m2: Any
-    machinelearning: Any
-    macie: Any
-    macie2: Any
-    managedblockchain: Any
-    marketplace_catalog: Any
-    marketplace_entitlement: Any
-    marketplacecommerceanalytics: Any
-    mediaconnect: Any
-    mediaconvert: Any
-    medialive: Any
-    mediapackage: Any
-    mediapackage_vod: Any
-    mediastore: Any
-    mediastore_data: Any
-    mediatailor: Any
-    memorydb: Any
-    meteringmarketplace: Any
-    mgh: Any
-    mgn: Any
-    migration_hub_refactor_spaces: Any
-    migrationhub_config: Any
-    migrationhuborchestrator: Any
-    migrationhubstrategy: Any
-    mobile: Any
-    mq: Any
-    mturk: Any
-    mwaa: Any
-    neptune: Any
-    network_firewall: Any
-    networkmanager: Any
-    nimble: Any
-    oam: Any
-    omics: Any
-    opensearch: Any
-    opensearchserverless: Any
-    opsworks: Any
-    opsworkscm: Any
-    organizations: Any
-    outposts: Any
-    panorama: Any
-    personalize: Any
-    personalize_events: Any
-    personalize_runtime: Any
-    pi: Any
-    pinpoint: Any
-    pinpoint_email: Any
-    pinpoint_sms_voice: Any
-    pinpoint_sms_voice_v2: Any
-    pipes: Any
-    polly: Any
-    pricing: Any
-    privatenetworks: Any
-    proton: Any
-    qldb: Any
-    qldb_session: Any
-    quicksight: Any
-    ram: Any
-    rbin: Any
-    rds: Any
-    rds_data: Any
-    redshift: Any
-    redshift_data: Any
-    redshift_serverless: Any
-    rekognition: Any
-    resiliencehub: Any
-    resource_explorer_2: Any
-    resource_groups: Any
-    resourcegroupstaggingapi: Any
-    robomaker: Any
-    rolesanywhere: Any
-    route53: Any
-    route53_recovery_cluster: Any
-    route53_recovery_control_config: Any
-    route53_recovery_readiness: Any
-    route53domains: Any
-    route53resolver: Any
-    rum: Any
-    s3: Any
-    s3control: Any
-    s3outposts: Any
-    sagemaker: Any
-    sagemaker_a2i_runtime: Any
-    sagemaker_edge: Any
-    sagemaker_featurestore_runtime: Any
-    sagemaker_geospatial: Any
-    sagemaker_metrics: Any
-    sagemaker_runtime: Any
-    savingsplans: Any
-    scheduler: Any
-    schemas: Any
-    sdb: Any
-    secretsmanager: Any
-    securityhub: Any
-    securitylake: Any
-    serverlessrepo: Any
-    service_quotas: Any
-    servicecatalog: Any
-    servicecatalog_appregistry: Any
-    servicediscovery: Any
-    ses: Any
-    sesv2: Any
-    shield: Any
-    signer: Any
-    simspaceweaver: Any
-    sms: Any
-    sms_voice: Any
-    snow_device_management: Any
-    snowball: Any
-    sns: Any
-    sqs: Any
-    ssm: Any
-    ssm_contacts: Any
-    ssm_incidents: Any
-    ssm_sap: Any
-    sso: Any
-    sso_admin: Any
-    sso_oidc: Any
-    stepfunctions: Any
-    storagegateway: Any
-    sts: Any
-    support: Any
-    support_app: Any
-    swf: Any
-    synthetics: Any
-    textract: Any
-    timestream_query: Any
-    timestream_write: Any
-    transcribe: Any
-    transfer: Any
-    translate: Any
-    voice_id: Any
-    waf: Any
-    waf_regional: Any
-    wafv2: Any
-    wellarchitected: Any
-    wisdom: Any
-    workdocs: Any
-    worklink: Any
-    workmail: Any
-    workmailmessageflow: Any
-    workspaces: Any
-    workspaces_web: Any
-    xray: Any
+    if TYPE_CHECKING:
+        # These are the xyn-resource `Resource` types/classes; ie: BotoClient subclasses
+        # (start with upper-case letter)
+        AccessAnalyzer: Type[BotoClient]
+        Account: Type[BotoClient]
+        Acm: Type[BotoClient]
+        Acm_Pca: Type[BotoClient]
+        AlexaForBusiness: Type[BotoClient]
+        Amp: Type[BotoClient]
+        Amplify: Type[BotoClient]
+        AmplifyBackend: Type[BotoClient]
+        AmplifyUiBuilder: Type[BotoClient]
+        ApiGateway: Type[BotoClient]
+        ApiGatewayManagementApi: Type[BotoClient]
+        ApiGatewayV2: Type[BotoClient]
+        AppConfig: Type[BotoClient]
+        AppConfigData: Type[BotoClient]
+        Appflow: Type[BotoClient]
+        AppIntegrations: Type[BotoClient]
+        Application_Autoscaling: Type[BotoClient]
+        Application_Insights: Type[BotoClient]
+        Applicationcostprofiler: Type[BotoClient]
+        Appmesh: Type[BotoClient]
+        Apprunner: Type[BotoClient]
+        Appstream: Type[BotoClient]
+        Appsync: Type[BotoClient]
+        Arc_Zonal_Shift: Type[BotoClient]
+        Athena: Type[BotoClient]
+        AuditManager: Type[BotoClient]
+        Autoscaling: Type[BotoClient]
+        Autoscaling_Plans: Type[BotoClient]
+        Backup: Type[BotoClient]
+        Backup_Gateway: Type[BotoClient]
+        BackupStorage: Type[BotoClient]
+        Batch: Type[BotoClient]
+        BillingConductor: Type[BotoClient]
+        Braket: Type[BotoClient]
+        Budgets: Type[BotoClient]
+        Ce: Type[BotoClient]
+        Chime: Type[BotoClient]
+        Chime_Sdk_Identity: Type[BotoClient]
+        Chime_Sdk_Media_Pipelines: Type[BotoClient]
+        Chime_Sdk_Meetings: Type[BotoClient]
+        Chime_Sdk_Messaging: Type[BotoClient]
+        Chime_Sdk_Voice: Type[BotoClient]
+        Cleanrooms: Type[BotoClient]
+        Cloud9: Type[BotoClient]
+        Cloudcontrol: Type[BotoClient]
+        Clouddirectory: Type[BotoClient]
+        Cloudformation: Type[BotoClient]
+        Cloudfront: Type[BotoClient]
+        Cloudhsm: Type[BotoClient]
+        Cloudhsmv2: Type[BotoClient]
+        Cloudsearch: Type[BotoClient]
+        Cloudsearchdomain: Type[BotoClient]
+        Cloudtrail: Type[BotoClient]
+        Cloudtrail_Data: Type[BotoClient]
+        Cloudwatch: Type[BotoClient]
+        CodeArtifact: Type[BotoClient]
+        CodeBuild: Type[BotoClient]
+        CodeCatalyst: Type[BotoClient]
+        CodeCommit: Type[BotoClient]
+        CodeDeploy: Type[BotoClient]
+        Codeguru_Reviewer: Type[BotoClient]
+        CodeguruProfiler: Type[BotoClient]
+        CodePipeline: Type[BotoClient]
+        Codestar: Type[BotoClient]
+        Codestar_Connections: Type[BotoClient]
+        Codestar_Notifications: Type[BotoClient]
+        Cognito_Identity: Type[BotoClient]
+        Cognito_Idp: Type[BotoClient]
+        Cognito_Sync: Type[BotoClient]
+        Comprehend: Type[BotoClient]
+        Comprehendmedical: Type[BotoClient]
+        Compute_Optimizer: Type[BotoClient]
+        Config: Type[BotoClient]
+        Connect: Type[BotoClient]
+        Connect_Contact_Lens: Type[BotoClient]
+        ConnectCampaigns: Type[BotoClient]
+        ConnectCases: Type[BotoClient]
+        ConnectParticipant: Type[BotoClient]
+        ControlTower: Type[BotoClient]
+        Cur: Type[BotoClient]
+        Customer_Profiles: Type[BotoClient]
+        DataBrew: Type[BotoClient]
+        DataExchange: Type[BotoClient]
+        DataPipeline: Type[BotoClient]
+        DataSync: Type[BotoClient]
+        Dax: Type[BotoClient]
+        Detective: Type[BotoClient]
+        Devicefarm: Type[BotoClient]
+        Devops_Guru: Type[BotoClient]
+        DirectConnect: Type[BotoClient]
+        Discovery: Type[BotoClient]
+        Dlm: Type[BotoClient]
+        Dms: Type[BotoClient]
+        Docdb: Type[BotoClient]
+        Docdb_Elastic: Type[BotoClient]
+        Drs: Type[BotoClient]
+        Ds: Type[BotoClient]
+        DynamoDb: Type[BotoClient]
+        DynamoDbStreams: Type[BotoClient]
+        Ebs: Type[BotoClient]
+        Ec2: Type[BotoClient]
+        Ec2_Instance_Connect: Type[BotoClient]
+        Ecr: Type[BotoClient]
+        Ecr_Public: Type[BotoClient]
+        Ecs: Type[BotoClient]
+        Efs: Type[BotoClient]
+        Eks: Type[BotoClient]
+        Elastic_Inference: Type[BotoClient]
+        Elasticache: Type[BotoClient]
+        ElasticBeanstalk: Type[BotoClient]
+        ElasticTranscoder: Type[BotoClient]
+        Elb: Type[BotoClient]
+        Elbv2: Type[BotoClient]
+        Emr: Type[BotoClient]
+        Emr_Containers: Type[BotoClient]
+        Emr_Serverless: Type[BotoClient]
+        Es: Type[BotoClient]
+        Events: Type[BotoClient]
+        Evidently: Type[BotoClient]
+        Finspace: Type[BotoClient]
+        Finspace_Data: Type[BotoClient]
+        Firehose: Type[BotoClient]
+        Fis: Type[BotoClient]
+        Fms: Type[BotoClient]
+        Forecast: Type[BotoClient]
+        Forecastquery: Type[BotoClient]
+        Frauddetector: Type[BotoClient]
+        Fsx: Type[BotoClient]
+        Gamelift: Type[BotoClient]
+        Gamesparks: Type[BotoClient]
+        Glacier: Type[BotoClient]
+        Globalaccelerator: Type[BotoClient]
+        Glue: Type[BotoClient]
+        Grafana: Type[BotoClient]
+        Greengrass: Type[BotoClient]
+        Greengrassv2: Type[BotoClient]
+        Groundstation: Type[BotoClient]
+        Guardduty: Type[BotoClient]
+        Health: Type[BotoClient]
+        Healthlake: Type[BotoClient]
+        Honeycode: Type[BotoClient]
+        Iam: Type[BotoClient]
+        IdentityStore: Type[BotoClient]
+        ImageBuilder: Type[BotoClient]
+        ImportExport: Type[BotoClient]
+        Inspector: Type[BotoClient]
+        Inspector2: Type[BotoClient]
+        Iot: Type[BotoClient]
+        Iot_Data: Type[BotoClient]
+        Iot_Jobs_Data: Type[BotoClient]
+        Iot_Roborunner: Type[BotoClient]
+        Iot1Click_Devices: Type[BotoClient]
+        Iot1Click_Projects: Type[BotoClient]
+        IotAnalytics: Type[BotoClient]
+        IotDeviceAdvisor: Type[BotoClient]
+        IotEvents: Type[BotoClient]
+        IotEvents_Data: Type[BotoClient]
+        IotFleethub: Type[BotoClient]
+        IotFleetwise: Type[BotoClient]
+        IotSecureTunneling: Type[BotoClient]
+        IotSitewise: Type[BotoClient]
+        IotThingsgraph: Type[BotoClient]
+        IotTwinmaker: Type[BotoClient]
+        IotWireless: Type[BotoClient]
+        Ivs: Type[BotoClient]
+        Ivschat: Type[BotoClient]
+        Kafka: Type[BotoClient]
+        Kafkaconnect: Type[BotoClient]
+        Kendra: Type[BotoClient]
+        Kendra_Ranking: Type[BotoClient]
+        Keyspaces: Type[BotoClient]
+        Kinesis: Type[BotoClient]
+        Kinesis_Video_Archived_Media: Type[BotoClient]
+        Kinesis_Video_Media: Type[BotoClient]
+        Kinesis_Video_Signaling: Type[BotoClient]
+        Kinesis_Video_Webrtc_Storage: Type[BotoClient]
+        KinesisAnalytics: Type[BotoClient]
+        KinesisAnalyticsv2: Type[BotoClient]
+        Kinesisvideo: Type[BotoClient]
+        Kms: Type[BotoClient]
+        Lakeformation: Type[BotoClient]
+        # Lambda Is A Key-Word, Underscore Is Ignored.
+        Lambda_: Type[BotoClient]
+        Lex_Models: Type[BotoClient]
+        Lex_Runtime: Type[BotoClient]
+        Lexv2_Models: Type[BotoClient]
+        Lexv2_Runtime: Type[BotoClient]
+        License_Manager: Type[BotoClient]
+        License_Manager_Linux_Subscriptions: Type[BotoClient]
+        License_Manager_User_Subscriptions: Type[BotoClient]
+        Lightsail: Type[BotoClient]
+        Location: Type[BotoClient]
+        Logs: Type[BotoClient]
+        LookoutEquipment: Type[BotoClient]
+        LookoutMetrics: Type[BotoClient]
+        LookoutVision: Type[BotoClient]
+        M2: Type[BotoClient]
+        MachineLearning: Type[BotoClient]
+        Macie: Type[BotoClient]
+        Macie2: Type[BotoClient]
+        ManagedBlockchain: Type[BotoClient]
+        MarketPlace_Catalog: Type[BotoClient]
+        MarketPlace_Entitlement: Type[BotoClient]
+        MarketPlacecommerceanalytics: Type[BotoClient]
+        MediaConnect: Type[BotoClient]
+        MediaConvert: Type[BotoClient]
+        MediaLive: Type[BotoClient]
+        MediaPackage: Type[BotoClient]
+        MediaPackage_Vod: Type[BotoClient]
+        MediaStore: Type[BotoClient]
+        MediaStore_Data: Type[BotoClient]
+        MediaTailor: Type[BotoClient]
+        MemoryDb: Type[BotoClient]
+        MeteringMarketplace: Type[BotoClient]
+        Mgh: Type[BotoClient]
+        Mgn: Type[BotoClient]
+        Migration_Hub_Refactor_Spaces: Type[BotoClient]
+        MigrationHub_Config: Type[BotoClient]
+        MigrationHubOrchestrator: Type[BotoClient]
+        MigrationHubStrategy: Type[BotoClient]
+        Mobile: Type[BotoClient]
+        Mq: Type[BotoClient]
+        Mturk: Type[BotoClient]
+        Mwaa: Type[BotoClient]
+        Neptune: Type[BotoClient]
+        Network_Firewall: Type[BotoClient]
+        Networkmanager: Type[BotoClient]
+        Nimble: Type[BotoClient]
+        Oam: Type[BotoClient]
+        Omics: Type[BotoClient]
+        Opensearch: Type[BotoClient]
+        OpensearchServerless: Type[BotoClient]
+        Opsworks: Type[BotoClient]
+        Opsworkscm: Type[BotoClient]
+        Organizations: Type[BotoClient]
+        Outposts: Type[BotoClient]
+        Panorama: Type[BotoClient]
+        Personalize: Type[BotoClient]
+        Personalize_Events: Type[BotoClient]
+        Personalize_Runtime: Type[BotoClient]
+        Pi: Type[BotoClient]
+        Pinpoint: Type[BotoClient]
+        Pinpoint_Email: Type[BotoClient]
+        Pinpoint_Sms_Voice: Type[BotoClient]
+        Pinpoint_Sms_Voice_V2: Type[BotoClient]
+        Pipes: Type[BotoClient]
+        Polly: Type[BotoClient]
+        Pricing: Type[BotoClient]
+        Privatenetworks: Type[BotoClient]
+        Proton: Type[BotoClient]
+        Qldb: Type[BotoClient]
+        Qldb_Session: Type[BotoClient]
+        Quicksight: Type[BotoClient]
+        Ram: Type[BotoClient]
+        Rbin: Type[BotoClient]
+        Rds: Type[BotoClient]
+        Rds_Data: Type[BotoClient]
+        Redshift: Type[BotoClient]
+        Redshift_Data: Type[BotoClient]
+        Redshift_Serverless: Type[BotoClient]
+        Rekognition: Type[BotoClient]
+        Resiliencehub: Type[BotoClient]
+        Resource_Explorer_2: Type[BotoClient]
+        Resource_Groups: Type[BotoClient]
+        ResourceGroupStaggingApi: Type[BotoClient]
+        Robomaker: Type[BotoClient]
+        Rolesanywhere: Type[BotoClient]
+        Route53: Type[BotoClient]
+        Route53_Recovery_Cluster: Type[BotoClient]
+        Route53_Recovery_Control_Config: Type[BotoClient]
+        Route53_Recovery_Readiness: Type[BotoClient]
+        Route53Domains: Type[BotoClient]
+        Route53Resolver: Type[BotoClient]
+        Rum: Type[BotoClient]
+        S3: Type[BotoClient]
+        S3Control: Type[BotoClient]
+        S3Outposts: Type[BotoClient]
+        Sagemaker: Type[BotoClient]
+        Sagemaker_A2I_Runtime: Type[BotoClient]
+        Sagemaker_Edge: Type[BotoClient]
+        Sagemaker_Featurestore_Runtime: Type[BotoClient]
+        Sagemaker_Geospatial: Type[BotoClient]
+        Sagemaker_Metrics: Type[BotoClient]
+        Sagemaker_Runtime: Type[BotoClient]
+        SavingsPlans: Type[BotoClient]
+        Scheduler: Type[BotoClient]
+        Schemas: Type[BotoClient]
+        Sdb: Type[BotoClient]
+        Secretsmanager: Type[BotoClient]
+        Securityhub: Type[BotoClient]
+        Securitylake: Type[BotoClient]
+        Serverlessrepo: Type[BotoClient]
+        Service_Quotas: Type[BotoClient]
+        ServiceCatalog: Type[BotoClient]
+        ServiceCatalog_Appregistry: Type[BotoClient]
+        ServiceDiscovery: Type[BotoClient]
+        Ses: Type[BotoClient]
+        Sesv2: Type[BotoClient]
+        Shield: Type[BotoClient]
+        Signer: Type[BotoClient]
+        Simspaceweaver: Type[BotoClient]
+        Sms: Type[BotoClient]
+        Sms_Voice: Type[BotoClient]
+        Snow_Device_Management: Type[BotoClient]
+        Snowball: Type[BotoClient]
+        Sns: Type[BotoClient]
+        Sqs: Type[BotoClient]
+        Ssm: Type[BotoClient]
+        Ssm_Contacts: Type[BotoClient]
+        Ssm_Incidents: Type[BotoClient]
+        Ssm_Sap: Type[BotoClient]
+        Sso: Type[BotoClient]
+        Sso_Admin: Type[BotoClient]
+        Sso_Oidc: Type[BotoClient]
+        StepFunctions: Type[BotoClient]
+        StorageGateway: Type[BotoClient]
+        Sts: Type[BotoClient]
+        Support: Type[BotoClient]
+        Support_App: Type[BotoClient]
+        Swf: Type[BotoClient]
+        Synthetics: Type[BotoClient]
+        Textract: Type[BotoClient]
+        Timestream_Query: Type[BotoClient]
+        Timestream_Write: Type[BotoClient]
+        Transcribe: Type[BotoClient]
+        Transfer: Type[BotoClient]
+        Translate: Type[BotoClient]
+        Voice_Id: Type[BotoClient]
+        Waf: Type[BotoClient]
+        Waf_Regional: Type[BotoClient]
+        Wafv2: Type[BotoClient]
+        WellArchitected: Type[BotoClient]
+        Wisdom: Type[BotoClient]
+        Workdocs: Type[BotoClient]
+        Worklink: Type[BotoClient]
+        Workmail: Type[BotoClient]
+        WorkmailMessageFlow: Type[BotoClient]
+        Workspaces: Type[BotoClient]
+        Workspaces_Web: Type[BotoClient]
+        Xray: Type[BotoClient]
+
+        # These are the boto client objects (start with lower-case letter)
+        accessanalyzer: Any
+        account: Any
+        acm: Any
+        acm_pca: Any
+        alexaforbusiness: Any
+        amp: Any
+        amplify: Any
+        amplifybackend: Any
+        amplifyuibuilder: Any
+        apigateway: Any
+        apigatewaymanagementapi: Any
+        apigatewayv2: Any
+        appconfig: Any
+        appconfigdata: Any
+        appflow: Any
+        appintegrations: Any
+        application_autoscaling: Any
+        application_insights: Any
+        applicationcostprofiler: Any
+        appmesh: Any
+        apprunner: Any
+        appstream: Any
+        appsync: Any
+        arc_zonal_shift: Any
+        athena: Any
+        auditmanager: Any
+        autoscaling: Any
+        autoscaling_plans: Any
+        backup: Any
+        backup_gateway: Any
+        backupstorage: Any
+        batch: Any
+        billingconductor: Any
+        braket: Any
+        budgets: Any
+        ce: Any
+        chime: Any
+        chime_sdk_identity: Any
+        chime_sdk_media_pipelines: Any
+        chime_sdk_meetings: Any
+        chime_sdk_messaging: Any
+        chime_sdk_voice: Any
+        cleanrooms: Any
+        cloud9: Any
+        cloudcontrol: Any
+        clouddirectory: Any
+        cloudformation: Any
+        cloudfront: Any
+        cloudhsm: Any
+        cloudhsmv2: Any
+        cloudsearch: Any
+        cloudsearchdomain: Any
+        cloudtrail: Any
+        cloudtrail_data: Any
+        cloudwatch: Any
+        codeartifact: Any
+        codebuild: Any
+        codecatalyst: Any
+        codecommit: Any
+        codedeploy: Any
+        codeguru_reviewer: Any
+        codeguruprofiler: Any
+        codepipeline: Any
+        codestar: Any
+        codestar_connections: Any
+        codestar_notifications: Any
+        cognito_identity: Any
+        cognito_idp: Any
+        cognito_sync: Any
+        comprehend: Any
+        comprehendmedical: Any
+        compute_optimizer: Any
+        config: Any
+        connect: Any
+        connect_contact_lens: Any
+        connectcampaigns: Any
+        connectcases: Any
+        connectparticipant: Any
+        controltower: Any
+        cur: Any
+        customer_profiles: Any
+        databrew: Any
+        dataexchange: Any
+        datapipeline: Any
+        datasync: Any
+        dax: Any
+        detective: Any
+        devicefarm: Any
+        devops_guru: Any
+        directconnect: Any
+        discovery: Any
+        dlm: Any
+        dms: Any
+        docdb: Any
+        docdb_elastic: Any
+        drs: Any
+        ds: Any
+        dynamodb: Any
+        dynamodbstreams: Any
+        ebs: Any
+        ec2: Any
+        ec2_instance_connect: Any
+        ecr: Any
+        ecr_public: Any
+        ecs: Any
+        efs: Any
+        eks: Any
+        elastic_inference: Any
+        elasticache: Any
+        elasticbeanstalk: Any
+        elastictranscoder: Any
+        elb: Any
+        elbv2: Any
+        emr: Any
+        emr_containers: Any
+        emr_serverless: Any
+        es: Any
+        events: Any
+        evidently: Any
+        finspace: Any
+        finspace_data: Any
+        firehose: Any
+        fis: Any
+        fms: Any
+        forecast: Any
+        forecastquery: Any
+        frauddetector: Any
+        fsx: Any
+        gamelift: Any
+        gamesparks: Any
+        glacier: Any
+        globalaccelerator: Any
+        glue: Any
+        grafana: Any
+        greengrass: Any
+        greengrassv2: Any
+        groundstation: Any
+        guardduty: Any
+        health: Any
+        healthlake: Any
+        honeycode: Any
+        iam: Any
+        identitystore: Any
+        imagebuilder: Any
+        importexport: Any
+        inspector: Any
+        inspector2: Any
+        iot: Any
+        iot_data: Any
+        iot_jobs_data: Any
+        iot_roborunner: Any
+        iot1click_devices: Any
+        iot1click_projects: Any
+        iotanalytics: Any
+        iotdeviceadvisor: Any
+        iotevents: Any
+        iotevents_data: Any
+        iotfleethub: Any
+        iotfleetwise: Any
+        iotsecuretunneling: Any
+        iotsitewise: Any
+        iotthingsgraph: Any
+        iottwinmaker: Any
+        iotwireless: Any
+        ivs: Any
+        ivschat: Any
+        kafka: Any
+        kafkaconnect: Any
+        kendra: Any
+        kendra_ranking: Any
+        keyspaces: Any
+        kinesis: Any
+        kinesis_video_archived_media: Any
+        kinesis_video_media: Any
+        kinesis_video_signaling: Any
+        kinesis_video_webrtc_storage: Any
+        kinesisanalytics: Any
+        kinesisanalyticsv2: Any
+        kinesisvideo: Any
+        kms: Any
+        lakeformation: Any
+        # Lambda is a key-word, underscore is ignored.
+        lambda_: Any
+        lex_models: Any
+        lex_runtime: Any
+        lexv2_models: Any
+        lexv2_runtime: Any
+        license_manager: Any
+        license_manager_linux_subscriptions: Any
+        license_manager_user_subscriptions: Any
+        lightsail: Any
+        location: Any
+        logs: Any
+        lookoutequipment: Any
+        lookoutmetrics: Any
+        lookoutvision: Any
+        m2: Any
+        machinelearning: Any
+        macie: Any
+        macie2: Any
+        managedblockchain: Any
+        marketplace_catalog: Any
+        marketplace_entitlement: Any
+        marketplacecommerceanalytics: Any
+        mediaconnect: Any
+        mediaconvert: Any
+        medialive: Any
+        mediapackage: Any
+        mediapackage_vod: Any
+        mediastore: Any
+        mediastore_data: Any
+        mediatailor: Any
+        memorydb: Any
+        meteringmarketplace: Any
+        mgh: Any
+        mgn: Any
+        migration_hub_refactor_spaces: Any
+        migrationhub_config: Any
+        migrationhuborchestrator: Any
+        migrationhubstrategy: Any
+        mobile: Any
+        mq: Any
+        mturk: Any
+        mwaa: Any
+        neptune: Any
+        network_firewall: Any
+        networkmanager: Any
+        nimble: Any
+        oam: Any
+        omics: Any
+        opensearch: Any
+        opensearchserverless: Any
+        opsworks: Any
+        opsworkscm: Any
+        organizations: Any
+        outposts: Any
+        panorama: Any
+        personalize: Any
+        personalize_events: Any
+        personalize_runtime: Any
+        pi: Any
+        pinpoint: Any
+        pinpoint_email: Any
+        pinpoint_sms_voice: Any
+        pinpoint_sms_voice_v2: Any
+        pipes: Any
+        polly: Any
+        pricing: Any
+        privatenetworks: Any
+        proton: Any
+        qldb: Any
+        qldb_session: Any
+        quicksight: Any
+        ram: Any
+        rbin: Any
+        rds: Any
+        rds_data: Any
+        redshift: Any
+        redshift_data: Any
+        redshift_serverless: Any
+        rekognition: Any
+        resiliencehub: Any
+        resource_explorer_2: Any
+        resource_groups: Any
+        resourcegroupstaggingapi: Any
+        robomaker: Any
+        rolesanywhere: Any
+        route53: Any
+        route53_recovery_cluster: Any
+        route53_recovery_control_config: Any
+        route53_recovery_readiness: Any
+        route53domains: Any
+        route53resolver: Any
+        rum: Any
+        s3: Any
+        s3control: Any
+        s3outposts: Any
+        sagemaker: Any
+        sagemaker_a2i_runtime: Any
+        sagemaker_edge: Any
+        sagemaker_featurestore_runtime: Any
+        sagemaker_geospatial: Any
+        sagemaker_metrics: Any
+        sagemaker_runtime: Any
+        savingsplans: Any
+        scheduler: Any
+        schemas: Any
+        sdb: Any
+        secretsmanager: Any
+        securityhub: Any
+        securitylake: Any
+        serverlessrepo: Any
+        service_quotas: Any
+        servicecatalog: Any
+        servicecatalog_appregistry: Any
+        servicediscovery: Any
+        ses: Any
+        sesv2: Any
+        shield: Any
+        signer: Any
+        simspaceweaver: Any
+        sms: Any
+        sms_voice: Any
+        snow_device_management: Any
+        snowball: Any
+        sns: Any
+        sqs: Any
+        ssm: Any
+        ssm_contacts: Any
+        ssm_incidents: Any
+        ssm_sap: Any
+        sso: Any
+        sso_admin: Any
+        sso_oidc: Any
+        stepfunctions: Any
+        storagegateway: Any
+        sts: Any
+        support: Any
+        support_app: Any
+        swf: Any
+        synthetics: Any
+        textract: Any
+        timestream_query: Any
+        timestream_write: Any
+        transcribe: Any
+        transfer: Any
+        translate: Any
+        voice_id: Any
+        waf: Any
+        waf_regional: Any
+        wafv2: Any
+        wellarchitected: Any
+        wisdom: Any
+        workdocs: Any
+        worklink: Any
+        workmail: Any
+        workmailmessageflow: Any
+        workspaces: Any
+        workspaces_web: Any
+        xray: Any
 
 
 class BotoResources(_Loader, boto_dependency_class=BotoResource):
@@ -1187,40 +1554,36 @@ class BotoResources(_Loader, boto_dependency_class=BotoResource):
     You can also directly use the `xboto.dependencies.BotoResources.load` method, and use a `-`
     there.
     """
+    __slots__ = ()
 
-    def _lookup(self, module, **kwargs):
-        return BotoResource.get_dependency_cls(module).grab().boto_resource
-
-    # These annotations are only for IDE-type-completion;
+    # These annotations are only for IDE-type-completion, so they are
+    # excluded from runtime entirely (no per-class __annotations__ cost);
     # any client boto supports will work regardless (even if not listed below).
-    #
-    # These are the xyn-resource `Resource` types/classes; ie: BotoResource subclasses
-    # (start with upper-case letter):
-    DynamoDB: Type[BotoResource]
-    CloudFormation: Type[BotoResource]
-    CloudWatch: Type[BotoResource]
-    Ec2: Type[BotoResource]
-    Glacier: Type[BotoResource]
-    Iam: Type[BotoResource]
-    OpsWorks: Type[BotoResource]
-    S3: Type[BotoResource]
-    Ns: Type[BotoResource]
-    Sqs: Type[BotoResource]
-
-    # These annotations are only for IDE-type-completion;
-    # any client boto supports will work regardless (even if not listed below).
-    #
-    # These are the boto resource objects (start with lower-case letter):
-    dynamodb: Any
-    cloudformation: Any
-    cloudwatch: Any
-    ec2: Any
-    glacier: Any
-    iam: Any
-    opsworks: Any
-    s3: Any
-    ns: Any
-    sqs: Any
+    if TYPE_CHECKING:
+        # These are the xyn-resource `Resource` types/classes; ie: BotoResource subclasses
+        # (start with upper-case letter):
+        DynamoDB: Type[BotoResource]
+        CloudFormation: Type[BotoResource]
+        CloudWatch: Type[BotoResource]
+        Ec2: Type[BotoResource]
+        Glacier: Type[BotoResource]
+        Iam: Type[BotoResource]
+        OpsWorks: Type[BotoResource]
+        S3: Type[BotoResource]
+        Ns: Type[BotoResource]
+        Sqs: Type[BotoResource]
+
+        # These are the boto resource objects (start with lower-case letter):
+        dynamodb: Any
+        cloudformation: Any
+        cloudwatch: Any
+        ec2: Any
+        glacier: Any
+        iam: Any
+        opsworks: Any
+        s3: Any
+        ns: Any
+        sqs: Any
 
 
 boto_clients = BotoClients.proxy()
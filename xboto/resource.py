@@ -24,35 +24,71 @@ All underscores are changed to a `-` when looking up the aws resource.
 You can also directly use the `xboto.dependencies.BotoResources.load` method, and use a `-` there.
 
 """
-from typing import Any
+import keyword
+import string
+from typing import FrozenSet, Optional
 
 from .dependencies import boto_resources
 
-# These annotations are only for IDE-type-completion;
-# any resource boto supports will work when asked for.
-# If you ask for an unsupported boto resource, error will be raised when you first use it
-# (not when you import it).
+_available: Optional[FrozenSet[str]] = None
 
-cloudformation: Any
-cloudwatch: Any
-dynamodb: Any
-ec2: Any
-glacier: Any
-iam: Any
-opsworks: Any
-s3: Any
-sns: Any
-sq: Any
+# First characters that can never start a resource name: underscores (dunder/private
+# probes from the import machinery and tooling), upper-case letters (reserved for a
+# future potential feature; ie: grab dependency class), or nothing at all.
+_BAD_FIRST_CHARS = frozenset(string.ascii_uppercase) | {'_', ''}
+
+
+def _load_available() -> FrozenSet[str]:
+    """
+    Lazily builds (and caches) the set of resource names boto knows about,
+    normalized so any `-` becomes a `_` (like our attribute names use).
+    """
+    global _available
+    if _available is None:
+        from .dependencies import _known_service_names
+        _available = frozenset(s.replace('-', '_') for s in _known_service_names('resource'))
+    return _available
+
+
+def _exportable_names():
+    # Like `_load_available`, but with Python-keyword names escaped to the
+    # trailing-underscore spelling used for attribute access (none today among
+    # resources, but ie: `lambda_` on the client side), so everything we
+    # advertise is actually importable/referenceable.
+    return {
+        name + '_' if keyword.iskeyword(name) else name
+        for name in _load_available()
+    }
+
+
+def __dir__():
+    # Everything already installed plus every resource name boto supports; answers
+    # tab-completion and `from xboto.resource import *` probes without creating anything.
+    return sorted(set(globals()) | _exportable_names())
 
 
 def __getattr__(name):
-    if name.startswith("_"):
-        raise AttributeError(f"module {__name__} has no attribute {name}")
+    if name == '__all__':
+        # Built on demand (ie: for star-imports) so plain imports don't pay the
+        # service scan; installed so it's only ever built once.
+        value = sorted(_exportable_names())
+        globals()['__all__'] = value
+        return value
 
-    # Reserve upper-case for future potential feature (ie: grab dependency class).
-    if name[0].isupper():
-        raise AttributeError(
-            f"module {__name__} has no attribute {name} (use lower-case attr; ie: {name.lower()})."
-        )
+    # Single set-membership check rejects every name we'd never resolve; the helpful
+    # per-case messages below only run on that cold path.
+    if name[:1] in _BAD_FIRST_CHARS:
+        if name[:1].isupper():
+            raise AttributeError(
+                f"module {__name__} has no attribute {name} "
+                f"(use lower-case attr; ie: {name.lower()})."
+            )
+        raise AttributeError(f"module {__name__} has no attribute {name}")
     from .dependencies import BotoResources
-    return BotoResources.proxy_attribute(name)
+    proxy = BotoResources.proxy_attribute(name)
+
+    # Proxies are stateless (they look up the current resource each time they are used),
+    # so install it into the module dict: later imports/attribute reads of this name
+    # are plain C-level module-dict hits and never re-enter this hook.
+    globals()[name] = proxy
+    return proxy
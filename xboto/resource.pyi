@@ -0,0 +1,19 @@
+# Type-hints for common boto resources, for IDE-type-completion;
+# any resource boto supports will work when asked for
+# (even if not listed below, see module docstring in `resource.py`).
+#
+# Generated by `scripts/gen_stubs.py`; re-run that instead of editing by hand.
+from typing import Any
+
+cloudformation: Any
+cloudwatch: Any
+dynamodb: Any
+ec2: Any
+glacier: Any
+iam: Any
+s3: Any
+sns: Any
+sqs: Any
+
+
+def __getattr__(name: str) -> Any: ...